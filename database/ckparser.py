@@ -28,6 +28,8 @@ forced_list_keys = []  # "if", "else_if", "else", "not", "or", "and", "nor", "na
 forced_string_keys = [("genes", None)]
 # Special keywords
 keywords = ("scripted_trigger", "scripted_effect")
+# Color conversion functions by color type
+color_functions = {"hsv": colorsys.hsv_to_rgb, "hls": colorsys.hls_to_rgb}
 # Variables collected in files
 variables = {}
 
@@ -71,15 +73,14 @@ def convert_color(color):
             color_type = "hsv"
         if color_type != "rgb":
             try:
-                functions = {"hsv": colorsys.hsv_to_rgb, "hls": colorsys.hls_to_rgb}
-                color = functions.get(color_type)(*color)
+                color = color_functions.get(color_type)(*color)
             except:  # noqa
                 logger.warning(f"Unable to convert color {color} ({color_type}")
                 return ""
     if any(isinstance(c, float) for c in color):
         color = [round(c * 255) for c in color]
-    r, g, b = (hex(int(c)).split("x")[-1] for c in color[:3])
-    return f"{r:>02}{g:>02}{b:>02}"
+    r, g, b = (abs(int(c)) for c in color[:3])
+    return f"{r:02x}{g:02x}{b:02x}"
 
 
 def convert_date(date, key=None):
@@ -450,6 +451,7 @@ def parse_all_files(
     save=False,
     comments=False,
     variables_first=True,
+    includes=None,
 ):
     """
     Parse all text files in a directory
@@ -460,12 +462,28 @@ def parse_all_files(
     :param save: (default false) Save every parsed data in output directory
     :param comments: Include comments?
     :param variables_first: Try to parse variables first
+    :param includes: Only parse files in these relative directories (e.g. "common/traits/")
     :return: Dictionary (key: file, value: parsed data if keep_data=True)
     """
     start_time = datetime.datetime.utcnow()
     success, errors = {}, []
+    includes = tuple(includes or ())
     for loop in range(2):
-        for current_path, _, all_files in os.walk(path):
+        for current_path, directories, all_files in os.walk(path):
+            if includes:
+                relative_path = os.path.relpath(current_path, path).replace(os.sep, "/").lower()
+                relative_path = "" if relative_path == "." else f"{relative_path}/"
+                directories[:] = [
+                    directory
+                    for directory in directories
+                    if any(
+                        include.startswith(f"{relative_path}{directory.lower()}/")
+                        or f"{relative_path}{directory.lower()}/".startswith(include)
+                        for include in includes
+                    )
+                ]
+                if not relative_path.startswith(includes):
+                    continue
             if variables_first:
                 if not loop and not current_path.endswith("script_values"):
                     continue
@@ -8,8 +8,15 @@ import re
 from functools import partial
 
 from django.core.management import BaseCommand
+from django.db import connection, transaction
 from tqdm.auto import tqdm
 
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from database.ckparser import (
     convert_color,
     convert_date,
@@ -62,6 +69,7 @@ from database.models import (
     TraitCompatibility,
     TraitTrack,
     War,
+    bulk_set_relations,
     to_pdx_date,
 )
 
@@ -78,10 +86,61 @@ title_tiers = {
     "c": "county",
     "b": "barony",
 }
+data_paths = (
+    "common/buildings/",
+    "common/casus_belli_groups/",
+    "common/casus_belli_types/",
+    "common/coat_of_arms/coat_of_arms/",
+    "common/culture/",
+    "common/deathreasons/",
+    "common/dna_data/",
+    "common/dynasties/",
+    "common/dynasty_houses/",
+    "common/ethnicities/",
+    "common/holdings/",
+    "common/landed_titles/",
+    "common/laws/",
+    "common/men_at_arms_types/",
+    "common/nicknames/",
+    "common/province_terrain/",
+    "common/religion/",
+    "common/script_values/",
+    "common/terrain_types/",
+    "common/traits/",
+    "history/",
+)
 
 tqdm = partial(tqdm, bar_format="{l_bar:.>40}{bar}{r_bar:.<40}")
 
 
+def save_json(path, data, sort_keys=True):
+    """
+    Save data in a JSON file, using orjson if available
+    :param path: Path to file
+    :param data: Data to save
+    :param sort_keys: Sort keys of dictionaries
+    :return: Nothing
+    """
+    if orjson:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        with open(path, "wb") as file:
+            file.write(orjson.dumps(data, option=option))
+        return
+    with open(path, "w") as file:
+        json.dump(data, file, indent=4, sort_keys=sort_keys)
+
+
+def load_json(path):
+    """
+    Load data from a JSON file, using orjson if available
+    :param path: Path to file
+    :return: Data
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
 class Command(BaseCommand):
     help = "Import data from Crusader Kings repositories"
     leave_locale_alone = True
@@ -94,7 +153,9 @@ class Command(BaseCommand):
         parser.add_argument("--reset", action="store_true", help="Reset locales and parsed files")
         parser.add_argument("--purge", action="store_true", help="Purge non created/updated records")
         parser.add_argument("--skip-locales", action="store_true", help="Skip locales")
+        parser.add_argument("--skip-raw-data", action="store_true", help="Skip raw data")
 
+    @transaction.atomic
     def handle(
         self,
         base_path,
@@ -104,37 +165,48 @@ class Command(BaseCommand):
         reset=False,
         purge=False,
         skip_locales=False,
+        skip_raw_data=False,
         *args,
         **options,
     ):
         global_start = datetime.datetime.now()
-        all_objects, all_stats, all_missings, all_duplicates = {}, {}, {}, {}
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+        all_objects, all_existing_objects, all_stats = collections.defaultdict(dict), {}, {}
+        all_missings, all_duplicates = collections.defaultdict(set), collections.defaultdict(list)
+        all_cached_dates, all_cached_keys, all_cached_locales = {}, {}, {False: {}, True: {}}
+        match_date = regex_date.fullmatch
 
         def mark_as_done(model, count, date):
             total_time = (datetime.datetime.now() - date).total_seconds()
             all_stats[model._meta.object_name] = {"count": count, "time": total_time}
-            with open("_all_stats.json", "w") as file:
-                json.dump(all_stats, file, indent=4, sort_keys=True)
             logger.info(f"{count} {model._meta.verbose_name_plural} in {total_time:0.2f}s")
 
         def get_object(model, key):
-            if not key or str(key) == "none":
+            if not key or key == "none":
                 return None
+            subobjects = all_objects[model]
+            if isinstance(key, (str, int)):
+                subkey = all_cached_keys.get((model, key), key)
+                if subkey in subobjects:
+                    return subobjects[subkey]
             model_name, verbose_name = model._meta.object_name, model._meta.verbose_name
             if isinstance(key, list):
                 logger.warning(f"Multiple keys {key} provided for {verbose_name}")
                 key = key[-1]
-            pk_field = model._meta.get_field("id")
-            key = pk_field.to_python(key)
-            subobjects = all_objects.setdefault(model, {})
+            pk_field = model._meta.pk
+            converted = pk_field.to_python(key)
+            all_cached_keys[model, key] = converted
+            key = converted
             if key in subobjects:
                 return subobjects[key]
-            name = (
-                get_locale(key)
-                or get_locale(f"{key}_name")
-                or get_locale(f"{model_name}_{key}")
-                or get_locale(f"{model_name}_{key}_name")
-            )
+            if model not in all_existing_objects:
+                all_existing_objects[model] = model.objects.in_bulk()
+            if obj := all_existing_objects[model].get(key):
+                subobjects[key] = obj
+                return obj
+            name = get_name(key) or get_name(f"{model_name}_{key}")
             description = (
                 get_locale(f"{key}_desc")
                 or get_locale(f"{key}_flavor")
@@ -150,84 +222,144 @@ class Command(BaseCommand):
                 ),
             )
             if created:
-                missings = all_missings.setdefault(model._meta.object_name, [])
-                missings.append(key)
-                missings.sort()
+                all_missings[model._meta.object_name].add(key)
                 logger.warning(f'Unknown {verbose_name} created for "{key}"')
             subobjects[key] = obj
             return obj
 
         def keep_object(model, object, warning=True):
-            objects = all_objects.setdefault(model, {})
+            objects = all_objects[model]
             if object.pk in objects:
-                all_duplicates.setdefault(model._meta.object_name, []).append(object.keys)
+                all_duplicates[model._meta.object_name].append(object.keys)
                 if warning:
                     logger.warning(f'Duplicated {model._meta.verbose_name} "{object.keys}" in different files')
             objects[object.pk] = object
-            missings = all_missings.setdefault(model._meta.object_name, [])
-            if object.pk in missings:
-                missings.remove(key)
+            all_missings[model._meta.object_name].discard(object.pk)
+
+        def get_sublocale(match):
+            return all_locales.get(match[2]) or match[1]
 
         def get_locale(key, keep=False):
             if isinstance(key, list):
                 logger.warning(f"Multiple keys {key} requested for locale")
                 key = key[-1]
+            cached_locales = all_cached_locales[keep]
+            if (locale := cached_locales.get(key)) is not None:
+                return locale
             locale = all_locales.get(key) or (key if keep else "") or ""
-            if locale:
-                for key, sublocale in regex_emphasis.findall(locale):
-                    locale = locale.replace(key, all_locales.get(sublocale) or key)
-                for key, sublocale in regex_sublocale.findall(locale):
-                    locale = locale.replace(key, all_locales.get(sublocale) or key)
+            if "|E]" in locale:
+                locale = regex_emphasis.sub(get_sublocale, locale)
+            if "$" in locale:
+                locale = regex_sublocale.sub(get_sublocale, locale)
+            cached_locales[key] = locale
             return locale
 
+        def get_name(key, suffix="name"):
+            return get_locale(key) or get_locale(f"{key}_{suffix}")
+
+        def get_object_id(model, key, keys):
+            if key and isinstance(key, (str, int)) and str(key) in keys:
+                return str(key)
+            return getattr(get_object(model, key), "pk", None)
+
+        def get_scoped_object(model, value, scope):
+            if type(value) is dict:
+                value = value.get("target")
+            if not value:
+                return None
+            if type(value) is not str or ":" not in value:
+                logger.debug(f'Unexpected scope for {model._meta.verbose_name}: "{value}"')
+                return None
+            if not value.startswith(f"{scope}:"):
+                return None
+            return get_object(model, value[len(scope) + 1 :])
+
         def get_value(item, key):
             value = item.get(key)
-            if isinstance(value, list):
+            if type(value) is list:
                 logger.warning(f'Unexpected multiple items for "{key}"')
                 value = value[-1]
-            if isinstance(value, dict) and "@type" in value:
+            if type(value) is dict and "@type" in value:
                 return value.get("@result") or None
             return value
 
+        def get_raw_data(data):
+            return None if skip_raw_data else data
+
+        def merge_item(item):
+            if type(item) is not list or not all(type(subitem) is dict for subitem in item):
+                return item, False
+            merged = {}
+            for subitem in item:
+                merged.update(subitem)
+            return merged, True
+
+        def get_date(date, key=None):
+            if date not in all_cached_dates:
+                if not (date[:1].isdigit() and match_date(date)):
+                    return None, None
+                if not (converted := convert_date(date, key)):
+                    return None, None
+                all_cached_dates[date] = converted, to_pdx_date(converted)
+            return all_cached_dates[date]
+
+        def get_files(prefix):
+            if prefix not in all_cached_files:
+                files = (
+                    item
+                    for directory, items in all_files.items()
+                    if f"{directory}/".startswith(prefix)
+                    for item in items
+                )
+                all_cached_files[prefix] = [file for position, file in sorted(files)]
+            return all_cached_files[prefix]
+
+        def free_files(*prefixes):
+            for prefix in prefixes:
+                for file in get_files(prefix):
+                    all_data.pop(file, None)
+
         # Parsing
         if reset:
             start_date = datetime.datetime.now()
-            all_data = parse_all_files(base_path, keep_data=True, save=save)
+            all_data = parse_all_files(base_path, keep_data=True, save=save, includes=data_paths)
             if mod_path:
                 for filename in os.listdir(mod_path):
                     if not filename.endswith(".mod"):
                         continue
                     if mod_data := parse_file(os.path.join(mod_path, filename), save=False):
                         excludes = mod_data.get("replace_path") or []
-                        for key in list(all_data.keys()):
-                            if any(key.startswith(exclude) for exclude in excludes):
-                                all_data.pop(key)
+                        excludes = tuple(excludes if isinstance(excludes, list) else [excludes])
+                        for key in [key for key in all_data if key.startswith(excludes)]:
+                            all_data.pop(key)
                         logger.info(f"Excluded paths by mod: {' '.join(excludes)}")
                     break
-                all_data.update(parse_all_files(mod_path, keep_data=True, save=save))
+                all_data.update(parse_all_files(mod_path, keep_data=True, save=save, includes=data_paths))
             all_data = {
-                key.lower(): value for key, value in sorted(all_data.items()) if unused or "unused" not in key.lower()
+                lower_key: value
+                for key, value in sorted(all_data.items())
+                if "unused" not in (lower_key := key.lower()) or unused
             }
-            with open("_all_data.json", "w") as file:
-                json.dump(all_data, file, indent=4)
-            with open("_all_variables.json", "w") as file:
-                json.dump(variables, file, indent=4, sort_keys=True)
+            all_variables = variables
+            save_json("_all_data.json", all_data, sort_keys=False)
+            save_json("_all_variables.json", all_variables)
             total_time = (datetime.datetime.now() - start_date).total_seconds()
             logger.info(f"Parsing files in {total_time:0.2f}s")
-        with open("_all_data.json") as file:
-            all_data = json.load(file)
-        with open("_all_variables.json") as file:
-            all_variables = json.load(file)
+        else:
+            all_data = load_json("_all_data.json")
+            all_variables = load_json("_all_variables.json")
+        all_files, all_cached_files = {}, {}
+        for position, (file, subdata) in enumerate(all_data.items()):
+            if subdata:
+                all_files.setdefault(os.path.dirname(file), []).append((position, file))
 
         # Localization
         start_date = datetime.datetime.now()
         all_locales, current_locales = {}, {}
         if not reset and os.path.exists("_all_locales.json"):
-            with open("_all_locales.json") as file:
-                all_locales = json.load(file)
+            all_locales = load_json("_all_locales.json")
             if mod_path and os.path.exists("_mod_locales.json"):
-                with open("_mod_locales.json") as file:
-                    current_locales = json.load(file)
+                current_locales = load_json("_mod_locales.json")
         else:
             current_locales = parse_all_locales(base_path)
             all_locales.update(current_locales)
@@ -235,282 +367,285 @@ class Command(BaseCommand):
                 current_locales = parse_all_locales(mod_path)
                 all_locales.update(current_locales)
             if mod_path:
-                with open("_mod_locales.json", "w") as file:
-                    json.dump(current_locales, file, indent=4, sort_keys=True)
-            with open("_all_locales.json", "w") as file:
-                json.dump(all_locales, file, indent=4, sort_keys=True)
-            with open("_all_locales.json") as file:
-                all_locales = json.load(file)
+                save_json("_mod_locales.json", current_locales)
+            save_json("_all_locales.json", all_locales)
         if not skip_locales:
-            for key, value in tqdm(current_locales.items(), desc="Locales"):
-                localization, created = Localization.objects.import_update_or_create(
-                    key=key,
-                    language="en",
-                    defaults=dict(
-                        text=value,
-                    ),
-                )
+            rows = [
+                (dict(key=key, language="en"), dict(text=value))
+                for key, value in tqdm(current_locales.items(), desc="Locales")
+            ]
+            for localization, created in Localization.objects.import_bulk_update_or_create(rows):
                 keep_object(Localization, localization)
             total_time = (datetime.datetime.now() - start_date).total_seconds()
             logger.info(f"Parsing locales in {total_time:0.2f}s")
 
         # Terrains
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/terrain_types/"):
-                continue
-            files.append(file)
+        files = get_files("common/terrain_types/")
+        rows = []
         for file in tqdm(files, desc="Terrains"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated terrain "{key}"')
-                    all_duplicates.setdefault(Terrain._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Terrain._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for terrain "{key}": "{item}"')
                     continue
-                terrain, created = Terrain.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_terrain"),
-                        color=convert_color(item.get("color")),
-                        movement_speed=get_value(item, "movement_speed"),
-                        combat_width=get_value(item, "combat_width"),
-                        audio_parameter=get_value(item, "audio_parameter"),
-                        supply_limit=item.get("province_modifier", {}).get("supply_limit_mult"),
-                        development_growth=item.get("province_modifier", {}).get("development_growth_factor"),
-                        attacker_hard_casualty=item.get("attacker_modifier", {}).get("hard_casualty_modifier"),
-                        attacker_retreat_losses=item.get("attacker_modifier", {}).get("retreat_losses"),
-                        defender_hard_casualty=item.get("defender_modifier", {}).get("hard_casualty_modifier"),
-                        defender_retreat_losses=item.get("defender_modifier", {}).get("retreat_losses"),
-                        defender_advantage=item.get("defender_combat_effects", {}).get("advantage"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                province_modifier = item.get("province_modifier") or {}
+                attacker_modifier = item.get("attacker_modifier") or {}
+                defender_modifier = item.get("defender_modifier") or {}
+                defender_combat_effects = item.get("defender_combat_effects") or {}
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key, "terrain"),
+                            color=convert_color(item.get("color")),
+                            movement_speed=get_value(item, "movement_speed"),
+                            combat_width=get_value(item, "combat_width"),
+                            audio_parameter=get_value(item, "audio_parameter"),
+                            supply_limit=province_modifier.get("supply_limit_mult"),
+                            development_growth=province_modifier.get("development_growth_factor"),
+                            attacker_hard_casualty=attacker_modifier.get("hard_casualty_modifier"),
+                            attacker_retreat_losses=attacker_modifier.get("retreat_losses"),
+                            defender_hard_casualty=defender_modifier.get("hard_casualty_modifier"),
+                            defender_retreat_losses=defender_modifier.get("retreat_losses"),
+                            defender_advantage=defender_combat_effects.get("advantage"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Terrain, terrain)
-                count += 1
-                terrain.created = created
+        for terrain, created in Terrain.objects.import_bulk_update_or_create(rows):
+            keep_object(Terrain, terrain)
+            count += 1
+            terrain.created = created
         mark_as_done(Terrain, count, start_date)
 
         # Men-at-arms
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/men_at_arms_types/"):
-                continue
-            files.append(file)
+        files = get_files("common/men_at_arms_types/")
+        rows, items = [], []
         for file in tqdm(files, desc="Men-at-arms"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated men-at-arms "{key}"')
-                    all_duplicates.setdefault(MenAtArms._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[MenAtArms._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for men-at-arms "{key}": "{item}"')
                     continue
-                buy_cost = get_value(item.get("buy_cost", {}), "gold")
+                buy_cost = get_value(item.get("buy_cost") or {}, "gold")
                 if isinstance(buy_cost, str):
                     buy_cost = None
-                low_maintenance_cost = get_value(item.get("low_maintenance_cost", {}), "gold")
+                low_maintenance_cost = get_value(item.get("low_maintenance_cost") or {}, "gold")
                 if isinstance(low_maintenance_cost, str):
                     low_maintenance_cost = None
-                high_maintenance_cost = get_value(item.get("high_maintenance_cost", {}), "gold")
+                high_maintenance_cost = get_value(item.get("high_maintenance_cost") or {}, "gold")
                 if isinstance(high_maintenance_cost, str):
                     high_maintenance_cost = None
-                men_at_arms, created = MenAtArms.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_flavor"),
-                        type=get_value(item, "type"),
-                        buy_cost=buy_cost,
-                        low_maintenance_cost=low_maintenance_cost,
-                        high_maintenance_cost=high_maintenance_cost,
-                        damage=get_value(item, "damage"),
-                        toughness=get_value(item, "toughness"),
-                        pursuit=get_value(item, "pursuit"),
-                        screen=get_value(item, "screen"),
-                        siege_tier=get_value(item, "siege_tier"),
-                        siege_value=get_value(item, "siege_value"),
-                        stack=get_value(item, "stack"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_flavor"),
+                            type=get_value(item, "type"),
+                            buy_cost=buy_cost,
+                            low_maintenance_cost=low_maintenance_cost,
+                            high_maintenance_cost=high_maintenance_cost,
+                            damage=get_value(item, "damage"),
+                            toughness=get_value(item, "toughness"),
+                            pursuit=get_value(item, "pursuit"),
+                            screen=get_value(item, "screen"),
+                            siege_tier=get_value(item, "siege_tier"),
+                            siege_value=get_value(item, "siege_value"),
+                            stack=get_value(item, "stack"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(MenAtArms, men_at_arms)
-                count += 1
-                men_at_arms.created = created
-                if men_at_arms.wip:
-                    continue
-                # Terrain modifiers
-                if modifiers := item.get("terrain_bonus"):
-                    for terrain, modifiers in modifiers.items():
-                        terrain_modifier, _ = TerrainModifier.objects.update_or_create(
-                            men_at_arms=men_at_arms,
-                            terrain=get_object(Terrain, terrain),
-                            defaults=dict(
+                items.append(item)
+        modifier_rows, counter_rows = [], []
+        for item, (men_at_arms, created) in zip(items, MenAtArms.objects.import_bulk_update_or_create(rows)):
+            keep_object(MenAtArms, men_at_arms)
+            count += 1
+            men_at_arms.created = created
+            if men_at_arms.wip:
+                continue
+            # Terrain modifiers
+            if modifiers := item.get("terrain_bonus"):
+                for terrain, modifiers in modifiers.items():
+                    modifier_rows.append(
+                        (
+                            dict(men_at_arms=men_at_arms, terrain=get_object(Terrain, terrain)),
+                            dict(
                                 damage=modifiers.get("damage"),
                                 toughness=modifiers.get("toughness"),
                                 pursuit=modifiers.get("pursuit"),
                                 screen=modifiers.get("screen"),
                             ),
                         )
-                        keep_object(TerrainModifier, terrain_modifier)
-                # Counters
-                if counters := item.get("counters"):
-                    for type, factor in counters.items():
-                        counter, _ = Counter.objects.update_or_create(
-                            men_at_arms=men_at_arms,
-                            type=type,
-                            defaults=dict(
+                    )
+            # Counters
+            if counters := item.get("counters"):
+                for counter_type, factor in counters.items():
+                    counter_rows.append(
+                        (
+                            dict(men_at_arms=men_at_arms, type=counter_type),
+                            dict(
                                 factor=factor,
                             ),
                         )
-                        keep_object(Counter, counter)
+                    )
+        for terrain_modifier, _ in TerrainModifier.objects.import_bulk_update_or_create(modifier_rows):
+            keep_object(TerrainModifier, terrain_modifier)
+        for counter, _ in Counter.objects.import_bulk_update_or_create(counter_rows):
+            keep_object(Counter, counter)
         mark_as_done(MenAtArms, count, start_date)
 
         # Casus belli groups
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/casus_belli_groups/"):
-                continue
-            files.append(file)
+        files = get_files("common/casus_belli_groups/")
+        rows = []
         for file in tqdm(files, desc="Casus belli groups"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated casus belli group "{key}"')
-                    all_duplicates.setdefault(Heritage._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Heritage._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     continue
-                casus_belli_group, created = CasusBelliGroup.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_desc"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(CasusBelliGroup, casus_belli_group)
-                count += 1
-                casus_belli_group.created = created
+        for casus_belli_group, created in CasusBelliGroup.objects.import_bulk_update_or_create(rows):
+            keep_object(CasusBelliGroup, casus_belli_group)
+            count += 1
+            casus_belli_group.created = created
         mark_as_done(CasusBelliGroup, count, start_date)
 
         # Casus belli
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/casus_belli_types/"):
-                continue
-            files.append(file)
+        files = get_files("common/casus_belli_types/")
+        rows = []
         for file in tqdm(files, desc="Casus belli"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated casus belli "{key}"')
-                    all_duplicates.setdefault(Heritage._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Heritage._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     continue
-                casus_belli, created = CasusBelli.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(item.get("war_name") or f"{key}_desc"),
-                        group=get_object(CasusBelliGroup, item.get("group")),
-                        target_titles=get_value(item, "target_titles") or "",
-                        target_title_tier=get_value(item, "target_title_tier") or "",
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(item.get("war_name") or f"{key}_desc"),
+                            group=get_object(CasusBelliGroup, item.get("group")),
+                            target_titles=get_value(item, "target_titles") or "",
+                            target_title_tier=get_value(item, "target_title_tier") or "",
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(CasusBelli, casus_belli)
-                count += 1
-                casus_belli.created = created
+        for casus_belli, created in CasusBelli.objects.import_bulk_update_or_create(rows):
+            keep_object(CasusBelli, casus_belli)
+            count += 1
+            casus_belli.created = created
         mark_as_done(CasusBelli, count, start_date)
 
         # Laws
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/laws/"):
-                continue
-            files.append(file)
+        files = get_files("common/laws/")
+        rows = []
         for file in tqdm(files, desc="Laws"):
             subdata = all_data[file]
             for group_key, group in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
                 if not group or not isinstance(group, dict):
                     continue
                 for key, item in group.items():
-                    if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                    item, duplicated = merge_item(item)
+                    if duplicated:
                         logger.warning(f'Duplicated law "{key}"')
-                        all_duplicates.setdefault(Law._meta.object_name, []).append(key)
-                        item = {k: v for d in item for k, v in d.items()}
-                    if not isinstance(item, dict):
+                        all_duplicates[Law._meta.object_name].append(key)
+                    if type(item) is not dict:
                         logger.debug(f'Unexpected data for law "{key}": "{item}"')
                         continue
-                    law, created = Law.objects.import_update_or_create(
-                        id=key,
-                        defaults=dict(
-                            name=get_locale(key) or get_locale(f"{key}_name"),
-                            description=get_locale(f"{key}_effects") or get_locale(f"{key}_desc"),
-                            group=group.get("flag", group_key),
-                            raw_data=item,
-                            exists=True,
-                        ),
+                    rows.append(
+                        (
+                            dict(id=key),
+                            dict(
+                                name=get_name(key),
+                                description=get_locale(f"{key}_effects") or get_locale(f"{key}_desc"),
+                                group=group.get("flag", group_key),
+                                raw_data=get_raw_data(item),
+                                exists=True,
+                            ),
+                        )
                     )
-                    keep_object(Law, law)
-                    count += 1
-                    law.created = created
+        for law, created in Law.objects.import_bulk_update_or_create(rows):
+            keep_object(Law, law)
+            count += 1
+            law.created = created
         mark_as_done(Law, count, start_date)
 
         # Buildings
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/buildings/"):
-                continue
-            files.append(file)
+        files = get_files("common/buildings/")
+        rows = []
         for file in tqdm(files, desc="Buildings"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated building "{key}"')
-                    all_duplicates.setdefault(Building._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Building._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for building "{key}": "{item}"')
                     continue
-                building, created = Building.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(f"building_{key}"),
-                        description=get_locale(f"building_{key}_desc"),
-                        type=get_value(item, "type") or "",
-                        construction_time=get_value(item, "construction_time"),
-                        cost_gold=get_value(item, "cost_gold"),
-                        cost_prestige=get_value(item, "cost_prestige"),
-                        levy=get_value(item, "cost_gold"),
-                        max_garrison=get_value(item, "max_garrison"),
-                        garrison_reinforcement_factor=get_value(item, "garrison_reinforcement_factor"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_locale(f"building_{key}"),
+                            description=get_locale(f"building_{key}_desc"),
+                            type=get_value(item, "type") or "",
+                            construction_time=get_value(item, "construction_time"),
+                            cost_gold=get_value(item, "cost_gold"),
+                            cost_prestige=get_value(item, "cost_prestige"),
+                            levy=get_value(item, "cost_gold"),
+                            max_garrison=get_value(item, "max_garrison"),
+                            garrison_reinforcement_factor=get_value(item, "garrison_reinforcement_factor"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Building, building)
-                count += 1
-                building.created = created
+        for building, created in Building.objects.import_bulk_update_or_create(rows):
+            keep_object(Building, building)
+            count += 1
+            building.created = created
         # Next buildings
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/buildings/"):
-                continue
+        next_buildings = []
+        for file in get_files("common/buildings/"):
+            subdata = all_data[file]
             for key, item in subdata.items():
                 if not isinstance(item, dict) or not item.get("next_building"):
                     continue
@@ -518,361 +653,287 @@ class Command(BaseCommand):
                 if building.wip:
                     continue
                 building.next_building = get_object(Building, item["next_building"])
-                if building.modified:
-                    building.save()
+                next_buildings.append(building)
+        Building.objects.import_bulk_update(next_buildings)
         mark_as_done(Building, count, start_date)
 
-        # Ethos
-        count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/pillars/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Ethos"):
-            subdata = all_data[file]
-            for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    logger.warning(f'Duplicated ethos "{key}"')
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict) or item.get("type") != "ethos":
-                    continue
-                ethos, created = Ethos.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        raw_data=item,
-                        exists=True,
-                    ),
-                )
-                keep_object(Ethos, ethos)
-                count += 1
-                ethos.created = created
-        mark_as_done(Ethos, count, start_date)
-
-        # Heritages
-        count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/pillars/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Heritages"):
-            subdata = all_data[file]
-            for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    logger.warning(f'Duplicated heritage "{key}"')
-                    all_duplicates.setdefault(Heritage._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict) or item.get("type") != "heritage":
-                    continue
-                heritage, created = Heritage.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_collective_noun"),
-                        raw_data=item,
-                        exists=True,
-                    ),
-                )
-                keep_object(Heritage, heritage)
-                count += 1
-                heritage.created = created
-        mark_as_done(Heritage, count, start_date)
-
-        # Languages
-        count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/pillars/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Languages"):
-            subdata = all_data[file]
-            for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    logger.warning(f'Duplicated language "{key}"')
-                    all_duplicates.setdefault(Language._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict) or item.get("type") != "language":
-                    continue
-                language, created = Language.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        raw_data=item,
-                        exists=True,
-                    ),
-                )
-                keep_object(Language, language)
-                count += 1
-                language.created = created
-        mark_as_done(Language, count, start_date)
-
-        # Martial customs
-        count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/pillars/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Martial customs"):
-            subdata = all_data[file]
-            for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    logger.warning(f'Duplicated martial custom "{key}"')
-                    all_duplicates.setdefault(MartialCustom._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict) or item.get("type") != "martial_custom":
-                    continue
-                martial_custom, created = MartialCustom.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        raw_data=item,
+        # Culture pillars
+        for model, pillar_type, description in (
+            (Ethos, "ethos", "desc"),
+            (Heritage, "heritage", "collective_noun"),
+            (Language, "language", None),
+            (MartialCustom, "martial_custom", "desc"),
+        ):
+            verbose_name = model._meta.verbose_name
+            count, start_date = 0, datetime.datetime.now()
+            files = get_files("common/culture/pillars/")
+            rows = []
+            for file in tqdm(files, desc=model._meta.verbose_name_plural.capitalize()):
+                subdata = all_data[file]
+                for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
+                    item, duplicated = merge_item(item)
+                    if duplicated:
+                        logger.warning(f'Duplicated {verbose_name} "{key}"')
+                        all_duplicates[model._meta.object_name].append(key)
+                    if not isinstance(item, dict) or item.get("type") != pillar_type:
+                        continue
+                    defaults = dict(
+                        name=get_name(key),
+                        raw_data=get_raw_data(item),
                         exists=True,
-                    ),
-                )
-                keep_object(MartialCustom, martial_custom)
+                    )
+                    if description:
+                        defaults.update(description=get_locale(f"{key}_{description}"))
+                    rows.append((dict(id=key), defaults))
+            for pillar, created in model.objects.import_bulk_update_or_create(rows):
+                keep_object(model, pillar)
                 count += 1
-                martial_custom.created = created
-        mark_as_done(MartialCustom, count, start_date)
+                pillar.created = created
+            mark_as_done(model, count, start_date)
 
         # Name lists
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/name_lists/"):
-                continue
-            files.append(file)
+        files = get_files("common/culture/name_lists/")
+        rows = []
         for file in tqdm(files, desc="Name lists"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated name list "{key}"')
-                    all_duplicates.setdefault(NameList._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[NameList._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for name list "{key}": "{item}"')
                     continue
-                name_list, created = NameList.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(NameList, name_list)
-                count += 1
-                name_list.created = created
+        for name_list, created in NameList.objects.import_bulk_update_or_create(rows):
+            keep_object(NameList, name_list)
+            count += 1
+            name_list.created = created
         mark_as_done(NameList, count, start_date)
 
         # Traditions
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/traditions/"):
-                continue
-            files.append(file)
+        files = get_files("common/culture/traditions/")
+        rows = []
         for file in tqdm(files, desc="Traditions"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated tradition "{key}"')
-                    all_duplicates.setdefault(Tradition._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Tradition._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for tradition "{key}": "{item}"')
                     continue
-                tradition, created = Tradition.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        category=get_value(item, "category"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_desc"),
+                            category=get_value(item, "category"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Tradition, tradition)
-                count += 1
-                tradition.created = created
+        for tradition, created in Tradition.objects.import_bulk_update_or_create(rows):
+            keep_object(Tradition, tradition)
+            count += 1
+            tradition.created = created
         mark_as_done(Tradition, count, start_date)
 
         # Eras
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/eras/"):
-                continue
-            files.append(file)
+        files = get_files("common/culture/eras/")
+        rows = []
         for file in tqdm(files, desc="Eras"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated era "{key}"')
-                    all_duplicates.setdefault(Era._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Era._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for era "{key}": "{item}"')
                     continue
-                era, created = Era.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        year=get_value(item, "year"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_desc"),
+                            year=get_value(item, "year"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Era, era)
-                count += 1
-                era.created = created
+        for era, created in Era.objects.import_bulk_update_or_create(rows):
+            keep_object(Era, era)
+            count += 1
+            era.created = created
         mark_as_done(Era, count, start_date)
 
         # Innovations
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/innovations/"):
-                continue
-            files.append(file)
+        files = get_files("common/culture/innovations/")
+        rows, items = [], []
         for file in tqdm(files, desc="Innovations"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated innovation "{key}"')
-                    all_duplicates.setdefault(Innovation._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Innovation._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for era "{key}": "{item}"')
                     continue
-                innovation, created = Innovation.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        group=get_value(item, "group"),
-                        era=get_object(Era, item.get("culture_era")),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_desc"),
+                            group=get_value(item, "group"),
+                            era=get_object(Era, item.get("culture_era")),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                if laws := item.get("unlock_law"):
-                    laws = laws if isinstance(laws, list) else [laws]
-                    innovation.unlock_laws.set([get_object(Law, key) for key in laws])
-                if men_at_arms := item.get("unlock_maa"):
-                    men_at_arms = men_at_arms if isinstance(men_at_arms, list) else [men_at_arms]
-                    innovation.unlock_men_at_arms.set([get_object(MenAtArms, key) for key in men_at_arms])
-                if buildings := item.get("unlock_building"):
-                    buildings = buildings if isinstance(buildings, list) else [buildings]
-                    innovation.unlock_buildings.set([get_object(Building, key) for key in buildings])
-                if casus_belli := item.get("unlock_casus_belli"):
-                    casus_belli = casus_belli if isinstance(casus_belli, list) else [casus_belli]
-                    innovation.unlock_casus_belli.set([get_object(CasusBelli, key) for key in casus_belli])
-                keep_object(Innovation, innovation)
-                count += 1
-                innovation.created = created
+                items.append(item)
+        innovation_laws, innovation_men_at_arms, innovation_buildings, innovation_casus_belli = {}, {}, {}, {}
+        for item, (innovation, created) in zip(items, Innovation.objects.import_bulk_update_or_create(rows)):
+            if laws := item.get("unlock_law"):
+                laws = laws if isinstance(laws, list) else [laws]
+                innovation_laws[innovation] = [get_object(Law, key) for key in laws]
+            if men_at_arms := item.get("unlock_maa"):
+                men_at_arms = men_at_arms if isinstance(men_at_arms, list) else [men_at_arms]
+                innovation_men_at_arms[innovation] = [get_object(MenAtArms, key) for key in men_at_arms]
+            if buildings := item.get("unlock_building"):
+                buildings = buildings if isinstance(buildings, list) else [buildings]
+                innovation_buildings[innovation] = [get_object(Building, key) for key in buildings]
+            if casus_belli := item.get("unlock_casus_belli"):
+                casus_belli = casus_belli if isinstance(casus_belli, list) else [casus_belli]
+                innovation_casus_belli[innovation] = [get_object(CasusBelli, key) for key in casus_belli]
+            keep_object(Innovation, innovation)
+            count += 1
+            innovation.created = created
+        bulk_set_relations(Innovation.unlock_laws, innovation_laws)
+        bulk_set_relations(Innovation.unlock_men_at_arms, innovation_men_at_arms)
+        bulk_set_relations(Innovation.unlock_buildings, innovation_buildings)
+        bulk_set_relations(Innovation.unlock_casus_belli, innovation_casus_belli)
         mark_as_done(Innovation, count, start_date)
 
         # Ethnicities
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/ethnicities/"):
-                continue
-            files.append(file)
+        files = get_files("common/ethnicities/")
+        rows = []
         for file in tqdm(files, desc="Ethnicities"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated ethnicity "{key}"')
-                    all_duplicates.setdefault(Ethnicity._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Ethnicity._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for ethnicity "{key}": "{item}"')
                     continue
                 if not item.get("template"):
                     continue
-                ethnicity, created = Ethnicity.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Ethnicity, ethnicity)
-                count += 1
-                ethnicity.created = created
+        for ethnicity, created in Ethnicity.objects.import_bulk_update_or_create(rows):
+            keep_object(Ethnicity, ethnicity)
+            count += 1
+            ethnicity.created = created
         mark_as_done(Ethnicity, count, start_date)
 
         # Cultures
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/culture/cultures/"):
-                continue
-            files.append(file)
+        files = get_files("common/culture/cultures/")
+        rows, items = [], []
         for file in tqdm(files, desc="Cultures"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated culture "{key}"')
-                    all_duplicates.setdefault(Culture._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Culture._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for culture "{key}": "{item}"')
                     continue
-                culture, created = Culture.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        ethos=get_object(Ethos, item.get("ethos")),
-                        heritage=get_object(Heritage, item.get("heritage")),
-                        language=get_object(Language, item.get("language")),
-                        martial_custom=get_object(MartialCustom, item.get("martial_custom")),
-                        name_list=get_object(NameList, item.get("name_list")),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            ethos=get_object(Ethos, item.get("ethos")),
+                            heritage=get_object(Heritage, item.get("heritage")),
+                            language=get_object(Language, item.get("language")),
+                            martial_custom=get_object(MartialCustom, item.get("martial_custom")),
+                            name_list=get_object(NameList, item.get("name_list")),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Culture, culture)
-                count += 1
-                culture.created = created
-                if culture.wip:
-                    continue
-                # Culture traditions
-                if traditions := item.get("traditions"):
-                    traditions = traditions if isinstance(traditions, list) else [traditions]
-                    culture.traditions.set([get_object(Tradition, key) for key in traditions])
-                # Culture ethnicities
-                if item.get("ethnicities"):
-                    for chance, keys in item.get("ethnicities").items():
-                        for key in keys if isinstance(keys, list) else [keys]:
-                            culture_ethnicity, _ = CultureEthnicity.objects.update_or_create(
-                                culture=culture,
-                                ethnicity=get_object(Ethnicity, key),
-                                defaults=dict(
+                items.append(item)
+        culture_traditions, ethnicity_rows = {}, []
+        for item, (culture, created) in zip(items, Culture.objects.import_bulk_update_or_create(rows)):
+            keep_object(Culture, culture)
+            count += 1
+            culture.created = created
+            if culture.wip:
+                continue
+            # Culture traditions
+            if traditions := item.get("traditions"):
+                traditions = traditions if isinstance(traditions, list) else [traditions]
+                culture_traditions[culture] = [get_object(Tradition, key) for key in traditions]
+            # Culture ethnicities
+            if item.get("ethnicities"):
+                for chance, keys in item.get("ethnicities").items():
+                    for key in keys if isinstance(keys, list) else [keys]:
+                        ethnicity_rows.append(
+                            (
+                                dict(culture=culture, ethnicity=get_object(Ethnicity, key)),
+                                dict(
                                     chance=int(chance),
                                 ),
                             )
-                            keep_object(CultureEthnicity, culture_ethnicity)
+                        )
+        bulk_set_relations(Culture.traditions, culture_traditions)
+        for culture_ethnicity, _ in CultureEthnicity.objects.import_bulk_update_or_create(ethnicity_rows):
+            keep_object(CultureEthnicity, culture_ethnicity)
         mark_as_done(Culture, count, start_date)
 
         # Culture & heritage history
         count_heritage, count_culture, start_date = 0, 0, datetime.datetime.now()
         files = {}
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/cultures/"):
-                continue
+        for file in get_files("history/cultures/"):
+            subdata = all_data[file]
             key = os.path.basename(file)
             for model in (Heritage, Culture):
-                instance = all_objects.setdefault(model, {}).get(key)
+                instance = all_objects[model].get(key)
                 if not instance or instance.wip:
                     continue
                 files.setdefault(model, []).append(file)
@@ -880,19 +941,19 @@ class Command(BaseCommand):
             (Heritage, HeritageHistory, "heritage", "Heritage history"),
             (Culture, CultureHistory, "culture", "Culture history"),
         ):
-            histories = {}
+            rows, items, histories, history_innovations = [], [], {}, {}
             for file in tqdm(files[model], desc=name):
                 subdata = all_data[file]
                 key = os.path.basename(file)
-                instance = all_objects.setdefault(model, {}).get(key)
+                instance = all_objects[model].get(key)
                 if not instance or instance.wip:
                     continue
                 for date, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                    if date := regex_date.fullmatch(date) and convert_date(date, key):
-                        pdx_date = to_pdx_date(date)
+                    date, pdx_date = get_date(date, key)
+                    if date:
                         if isinstance(item, list):
                             logger.warning(f'Duplicated {field} history "{key}" for "{pdx_date}"')
-                            all_duplicates.setdefault(history_model._meta.object_name, []).append((key, pdx_date))
+                            all_duplicates[history_model._meta.object_name].append((key, pdx_date))
                             item = {k: v for d in item for k, v in d.items()}
                         if not isinstance(item, dict):
                             continue
@@ -900,57 +961,57 @@ class Command(BaseCommand):
                             logger.warning(f'Duplicated {field} history "{key}" for "{pdx_date}" in different files')
                             item = {**previous_history, **item}
                         histories[key, date] = item
-                        history, created = history_model.objects.update_or_create(
-                            defaults=dict(
-                                join_era=get_object(Era, item.get("join_era")),
-                                raw_data=item,
-                            ),
-                            date=date,
-                            **{field: instance},
-                        )
-                        keep_object(history_model, history, warning=True)
-                        count_heritage += 1 if history_model is HeritageHistory else 0
-                        count_culture += 1 if history_model is CultureHistory else 0
-                        history.created = created
-                        if innovations := item.get("discover_innovation"):
-                            innovations = innovations if isinstance(innovations, list) else [innovations]
-                            history.discover_innovations.set(
-                                [get_object(Innovation, innovation) for innovation in innovations]
+                        rows.append(
+                            (
+                                {field: instance, "date": date},
+                                dict(
+                                    join_era=get_object(Era, item.get("join_era")),
+                                    raw_data=get_raw_data(item),
+                                ),
                             )
+                        )
+                        items.append(item)
+            for item, (history, created) in zip(items, history_model.objects.import_bulk_update_or_create(rows)):
+                keep_object(history_model, history, warning=True)
+                count_heritage += 1 if history_model is HeritageHistory else 0
+                count_culture += 1 if history_model is CultureHistory else 0
+                history.created = created
+                if innovations := item.get("discover_innovation"):
+                    innovations = innovations if isinstance(innovations, list) else [innovations]
+                    history_innovations[history] = [get_object(Innovation, innovation) for innovation in innovations]
+            bulk_set_relations(history_model.discover_innovations, history_innovations)
         mark_as_done(HeritageHistory, count_heritage, start_date)
         mark_as_done(CultureHistory, count_culture, start_date)
 
         # Traits
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/traits/"):
-                continue
-            files.append(file)
+        files = get_files("common/traits/")
+        rows, items, groups, trait_keys = [], [], {}, set()
         for file in tqdm(files, desc="Traits"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated trait "{key}"')
-                    all_duplicates.setdefault(Trait._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Trait._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for trait "{key}": "{item}"')
                     continue
-                group = None
-                if group_key := item.get("group"):
-                    group = all_objects.setdefault(Trait, {}).get(group_key)
-                    if not group:
-                        group, _ = Trait.objects.import_update_or_create(
-                            id=group_key,
-                            defaults=dict(
+                group_key = item.get("group") or None
+                if group_key and group_key not in all_objects[Trait] and group_key not in trait_keys:
+                    groups.setdefault(
+                        group_key,
+                        (
+                            dict(id=group_key),
+                            dict(
                                 name=get_locale(f"trait_{group_key}"),
                                 description=get_locale(f"trait_{group_key}_desc"),
                                 is_group=True,
                                 exists=True,
                             ),
-                        )
-                        keep_object(Trait, group)
+                        ),
+                    )
+                trait_keys.add(key)
                 if not (name := get_locale(f"trait_{key}")):
                     for val, keys in walk(item.get("name", {})):
                         if keys and keys[0] == "desc":
@@ -961,84 +1022,90 @@ class Command(BaseCommand):
                         if keys and keys[0] == "desc":
                             desc = get_locale(val)
                             break
-                trait, created = Trait.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=name,
-                        description=desc,
-                        group=group,
-                        is_group=False,
-                        category=item.get("category", ""),
-                        level=item.get("level"),
-                        minimum_age=get_value(item, "minimum_age"),
-                        maximum_age=get_value(item, "maximum_age"),
-                        is_good=bool(item.get("good")),
-                        is_physical=bool(item.get("physical") == "yes"),
-                        is_genetic=bool(item.get("genetic") == "yes"),
-                        is_health=bool(item.get("health_trait") == "yes"),
-                        is_fame=bool(item.get("fame") == "yes"),
-                        is_incapacitating=bool(item.get("incapacitating") == "yes"),
-                        is_immortal=bool(item.get("immortal") == "yes"),
-                        has_tracks=bool(item.get("track") or item.get("tracks")),
-                        can_inbred=bool(item.get("enables_inbred") == "yes"),
-                        can_have_children=bool(item.get("can_have_children") == "yes"),
-                        can_inherit=bool(item.get("inheritance_blocker")),
-                        can_not_marry=bool((item.get("flag") == "can_not_marry") or None),
-                        can_be_taken=bool(item.get("shown_in_ruler_designer") == "yes"),
-                        cost=get_value(item, "ruler_designer_cost"),
-                        birth_chance=get_value(item, "birth"),
-                        random_chance=get_value(item, "random_creation"),
-                        diplomacy=get_value(item, "diplomacy"),
-                        martial=get_value(item, "martial"),
-                        stewardship=get_value(item, "stewardship"),
-                        intrigue=get_value(item, "intrigue"),
-                        learning=get_value(item, "learning"),
-                        prowess=get_value(item, "prowess"),
-                        health=get_value(item, "health"),
-                        fertility=get_value(item, "fertility"),
-                        monthly_prestige=get_value(item, "monthly_prestige"),
-                        monthly_prestige_mult=get_value(item, "monthly_prestige_gain_mult"),
-                        monthly_piety=get_value(item, "monthly_piety"),
-                        monthly_piety_mult=get_value(item, "monthly_piety_gain_mult"),
-                        dread_gain_mult=get_value(item, "dread_gain_mult"),
-                        dread_loss_mult=get_value(item, "dread_loss_mult"),
-                        stress_gain_mult=get_value(item, "stress_gain_mult"),
-                        stress_loss_mult=get_value(item, "stress_loss_mult"),
-                        same_opinion=get_value(item, "same_opinion"),
-                        opposite_opinion=get_value(item, "opposite_opinion"),
-                        general_opinion=get_value(item, "general_opinion"),
-                        attraction_opinion=get_value(item, "attraction_opinion"),
-                        vassal_opinion=get_value(item, "vassal_opinion"),
-                        liege_opinion=get_value(item, "liege_opinion"),
-                        clergy_opinion=get_value(item, "clergy_opinion"),
-                        same_faith_opinion=get_value(item, "same_faith_opinion"),
-                        same_culture_opinion=get_value(item, "same_culture_opinion"),
-                        dynasty_opinion=get_value(item, "dynasty_opinion"),
-                        house_opinion=get_value(item, "dynasty_house_opinion"),
-                        ai_energy=get_value(item, "ai_energy"),
-                        ai_boldness=get_value(item, "ai_boldness"),
-                        ai_compassion=get_value(item, "ai_compassion"),
-                        ai_greed=get_value(item, "ai_greed"),
-                        ai_honor=get_value(item, "ai_honor"),
-                        ai_rationality=get_value(item, "ai_rationality"),
-                        ai_sociability=get_value(item, "ai_sociability"),
-                        ai_vengefulness=get_value(item, "ai_vengefulness"),
-                        ai_zeal=get_value(item, "ai_zeal"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=name,
+                            description=desc,
+                            group_id=group_key,
+                            is_group=False,
+                            category=item.get("category", ""),
+                            level=item.get("level"),
+                            minimum_age=get_value(item, "minimum_age"),
+                            maximum_age=get_value(item, "maximum_age"),
+                            is_good=bool(item.get("good")),
+                            is_physical=bool(item.get("physical") == "yes"),
+                            is_genetic=bool(item.get("genetic") == "yes"),
+                            is_health=bool(item.get("health_trait") == "yes"),
+                            is_fame=bool(item.get("fame") == "yes"),
+                            is_incapacitating=bool(item.get("incapacitating") == "yes"),
+                            is_immortal=bool(item.get("immortal") == "yes"),
+                            has_tracks=bool(item.get("track") or item.get("tracks")),
+                            can_inbred=bool(item.get("enables_inbred") == "yes"),
+                            can_have_children=bool(item.get("can_have_children") == "yes"),
+                            can_inherit=bool(item.get("inheritance_blocker")),
+                            can_not_marry=bool((item.get("flag") == "can_not_marry") or None),
+                            can_be_taken=bool(item.get("shown_in_ruler_designer") == "yes"),
+                            cost=get_value(item, "ruler_designer_cost"),
+                            birth_chance=get_value(item, "birth"),
+                            random_chance=get_value(item, "random_creation"),
+                            diplomacy=get_value(item, "diplomacy"),
+                            martial=get_value(item, "martial"),
+                            stewardship=get_value(item, "stewardship"),
+                            intrigue=get_value(item, "intrigue"),
+                            learning=get_value(item, "learning"),
+                            prowess=get_value(item, "prowess"),
+                            health=get_value(item, "health"),
+                            fertility=get_value(item, "fertility"),
+                            monthly_prestige=get_value(item, "monthly_prestige"),
+                            monthly_prestige_mult=get_value(item, "monthly_prestige_gain_mult"),
+                            monthly_piety=get_value(item, "monthly_piety"),
+                            monthly_piety_mult=get_value(item, "monthly_piety_gain_mult"),
+                            dread_gain_mult=get_value(item, "dread_gain_mult"),
+                            dread_loss_mult=get_value(item, "dread_loss_mult"),
+                            stress_gain_mult=get_value(item, "stress_gain_mult"),
+                            stress_loss_mult=get_value(item, "stress_loss_mult"),
+                            same_opinion=get_value(item, "same_opinion"),
+                            opposite_opinion=get_value(item, "opposite_opinion"),
+                            general_opinion=get_value(item, "general_opinion"),
+                            attraction_opinion=get_value(item, "attraction_opinion"),
+                            vassal_opinion=get_value(item, "vassal_opinion"),
+                            liege_opinion=get_value(item, "liege_opinion"),
+                            clergy_opinion=get_value(item, "clergy_opinion"),
+                            same_faith_opinion=get_value(item, "same_faith_opinion"),
+                            same_culture_opinion=get_value(item, "same_culture_opinion"),
+                            dynasty_opinion=get_value(item, "dynasty_opinion"),
+                            house_opinion=get_value(item, "dynasty_house_opinion"),
+                            ai_energy=get_value(item, "ai_energy"),
+                            ai_boldness=get_value(item, "ai_boldness"),
+                            ai_compassion=get_value(item, "ai_compassion"),
+                            ai_greed=get_value(item, "ai_greed"),
+                            ai_honor=get_value(item, "ai_honor"),
+                            ai_rationality=get_value(item, "ai_rationality"),
+                            ai_sociability=get_value(item, "ai_sociability"),
+                            ai_vengefulness=get_value(item, "ai_vengefulness"),
+                            ai_zeal=get_value(item, "ai_zeal"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Trait, trait)
-                count += 1
-                trait.created = created
-                if item.get("track") or item.get("tracks"):
-                    for code, track in (item.get("tracks") or {"": item.get("track")}).items():
-                        for level, subitem in track.items():
-                            trait_track, created = TraitTrack.objects.update_or_create(
-                                trait=get_object(Trait, key),
-                                code=code,
-                                level=all_variables.get(level, level),
-                                defaults=dict(
+                items.append(item)
+        for group, _ in Trait.objects.import_bulk_update_or_create(groups.values()):
+            keep_object(Trait, group)
+        track_rows = []
+        for item, (trait, created) in zip(items, Trait.objects.import_bulk_update_or_create(rows)):
+            keep_object(Trait, trait)
+            count += 1
+            trait.created = created
+            if item.get("track") or item.get("tracks"):
+                for code, track in (item.get("tracks") or {"": item.get("track")}).items():
+                    for level, subitem in track.items():
+                        track_rows.append(
+                            (
+                                dict(trait=trait, code=code, level=all_variables.get(level, level)),
+                                dict(
                                     diplomacy=get_value(subitem, "diplomacy"),
                                     martial=get_value(subitem, "martial"),
                                     stewardship=get_value(subitem, "stewardship"),
@@ -1075,21 +1142,22 @@ class Command(BaseCommand):
                                     ai_sociability=get_value(subitem, "ai_sociability"),
                                     ai_vengefulness=get_value(subitem, "ai_vengefulness"),
                                     ai_zeal=get_value(subitem, "ai_zeal"),
-                                    raw_data=subitem,
+                                    raw_data=get_raw_data(subitem),
                                 ),
                             )
-                            keep_object(TraitTrack, trait_track)
-                            trait_track.created = created
+                        )
+        for trait_track, created in TraitTrack.objects.import_bulk_update_or_create(track_rows):
+            keep_object(TraitTrack, trait_track)
+            trait_track.created = created
         mark_as_done(Trait, count, start_date)
 
         # Trait opposites and compatibilities
+        trait_opposites, compatibility_rows = {}, []
         count, start_date = 0, datetime.datetime.now()
-        for file, subdata in tqdm(all_data.items(), desc="Trait extra"):
-            if not subdata or not file.startswith("common/traits/"):
-                continue
+        for file in tqdm(get_files("common/traits/"), desc="Trait extra"):
+            subdata = all_data[file]
             for key, item in subdata.items():
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    item = {k: v for d in item for k, v in d.items()}
+                item, _ = merge_item(item)
                 if not isinstance(item, dict):
                     continue
                 # Trait opposites
@@ -1098,67 +1166,69 @@ class Command(BaseCommand):
                     if trait.wip:
                         continue
                     opposites = opposites if isinstance(opposites, list) else [opposites]
-                    trait.opposites.set([get_object(Trait, key) for key in opposites])
+                    trait_opposites[trait] = [get_object(Trait, key) for key in opposites]
                 # Trait compatibilities
                 if compatibilities := item.get("compatibility"):
                     for trait, score in compatibilities.items():
                         score = score[-1] if isinstance(score, list) else score
                         score = score.get("@result") if isinstance(score, dict) else score
-                        compatibility, created = TraitCompatibility.objects.update_or_create(
-                            first=get_object(Trait, key),
-                            trait=get_object(Trait, trait),
-                            defaults=dict(score=score),
+                        compatibility_rows.append(
+                            (
+                                dict(first=get_object(Trait, key), trait=get_object(Trait, trait)),
+                                dict(score=score),
+                            )
                         )
-                        keep_object(TraitCompatibility, compatibility)
-                        compatibility.created = created
-                        count += 1
+        for compatibility, created in TraitCompatibility.objects.import_bulk_update_or_create(compatibility_rows):
+            keep_object(TraitCompatibility, compatibility)
+            compatibility.created = created
+            count += 1
+        bulk_set_relations(Trait.opposites, trait_opposites)
         mark_as_done(TraitCompatibility, count, start_date)
 
         # Holdings
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/holdings/"):
-                continue
-            files.append(file)
+        files = get_files("common/holdings/")
+        rows, items, holding_buildings = [], [], {}
         for file in tqdm(files, desc="Holdings"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated holding "{key}"')
-                    all_duplicates.setdefault(Holding._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Holding._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for holding "{key}": "{item}"')
                     continue
-                holding, created = Holding.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        primary_building=get_object(Building, item.get("primary_building")),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            primary_building=get_object(Building, item.get("primary_building")),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Holding, holding)
-                count += 1
-                holding.created = created
-                if holding.wip:
-                    continue
-                # Holding buildings
-                if buildings := item.get("buildings"):
-                    buildings = buildings if isinstance(buildings, list) else [buildings]
-                    holding.buildings.set([get_object(Building, key) for key in buildings])
+                items.append(item)
+        for item, (holding, created) in zip(items, Holding.objects.import_bulk_update_or_create(rows)):
+            keep_object(Holding, holding)
+            count += 1
+            holding.created = created
+            if holding.wip:
+                continue
+            # Holding buildings
+            if buildings := item.get("buildings"):
+                buildings = buildings if isinstance(buildings, list) else [buildings]
+                holding_buildings[holding] = [get_object(Building, key) for key in buildings]
+        bulk_set_relations(Holding.buildings, holding_buildings)
         mark_as_done(Holding, count, start_date)
 
         # Doctrines
         doctrines_by_group = {}
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/religion/doctrines/"):
-                continue
-            files.append(file)
+        files = get_files("common/religion/doctrines/")
+        rows, items = [], []
         for file in tqdm(files, desc="Doctrines"):
             subdata = all_data[file]
             for group_key, group in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
@@ -1166,59 +1236,69 @@ class Command(BaseCommand):
                     continue
                 group_set = doctrines_by_group.setdefault(group_key, set())
                 for key, item in group.items():
-                    if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                    item, duplicated = merge_item(item)
+                    if duplicated:
                         logger.warning(f'Duplicated doctrine "{key}"')
-                        all_duplicates.setdefault(Doctrine._meta.object_name, []).append(key)
-                        item = {k: v for d in item for k, v in d.items()}
+                        all_duplicates[Doctrine._meta.object_name].append(key)
                     if not isinstance(item, dict) or not ("doctrine" in key or "tenet" in key):
                         logger.debug(f'Unexpected data for doctrine "{key}": "{item}"')
                         continue
                     group_set.add(key)
-                    group_name = get_locale(group_key) or get_locale(f"{group_key}_name")
-                    doctrine_name = get_locale(key) or get_locale(f"{key}_name")
+                    group_name = get_name(group_key)
+                    doctrine_name = get_name(key)
                     if group_name and doctrine_name:
                         doctrine_name = f"{group_name}: {doctrine_name}"
-                    doctrine, created = Doctrine.objects.import_update_or_create(
-                        id=key,
-                        defaults=dict(
-                            name=doctrine_name,
-                            description=get_locale(f"{key}_desc"),
-                            group=group_key,
-                            multiple=group.get("number_of_picks"),
-                            raw_data=item,
-                            exists=True,
-                        ),
+                    rows.append(
+                        (
+                            dict(id=key),
+                            dict(
+                                name=doctrine_name,
+                                description=get_locale(f"{key}_desc"),
+                                group=group_key,
+                                multiple=group.get("number_of_picks"),
+                                raw_data=get_raw_data(item),
+                                exists=True,
+                            ),
+                        )
                     )
-                    keep_object(Doctrine, doctrine)
-                    count += 1
-                    doctrine.created = created
-                    if doctrine.wip:
-                        continue
-                    # Doctrine traits
-                    if traits := item.get("traits"):
-                        for trait_type, values in traits.items():
-                            values = values.items() if isinstance(values, dict) else ((val, 1) for val in values)
-                            for trait, piety in values:
-                                if isinstance(piety, dict):
-                                    piety = piety["weight"]
-                                doctrine_trait, _ = DoctrineTrait.objects.update_or_create(
-                                    doctrine=doctrine,
-                                    trait=get_object(Trait, trait),
-                                    defaults=dict(
-                                        is_virtue=trait_type == "virtues",
-                                        piety=piety,
-                                    ),
-                                )
-                                keep_object(DoctrineTrait, doctrine_trait)
+                    items.append(item)
+        trait_rows = []
+        for item, (doctrine, created) in zip(items, Doctrine.objects.import_bulk_update_or_create(rows)):
+            keep_object(Doctrine, doctrine)
+            count += 1
+            doctrine.created = created
+            if doctrine.wip:
+                continue
+            # Doctrine traits
+            if traits := item.get("traits"):
+                for trait_type, values in traits.items():
+                    values = values.items() if isinstance(values, dict) else ((val, 1) for val in values)
+                    for trait, piety in values:
+                        if isinstance(piety, dict):
+                            piety = piety["weight"]
+                        trait_rows.append(
+                            (
+                                dict(doctrine=doctrine, trait=get_object(Trait, trait)),
+                                dict(
+                                    is_virtue=trait_type == "virtues",
+                                    piety=piety,
+                                ),
+                            )
+                        )
+        for doctrine_trait, _ in DoctrineTrait.objects.import_bulk_update_or_create(trait_rows):
+            keep_object(DoctrineTrait, doctrine_trait)
         mark_as_done(Doctrine, count, start_date)
 
         # Religions
-        count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/religion/religions/"):
+        doctrine_groups = {}
+        for name, values in doctrines_by_group.items():
+            if "tenets" in name:
                 continue
-            files.append(file)
+            for doctrine in values:
+                doctrine_groups.setdefault(doctrine, values)
+        count, start_date = 0, datetime.datetime.now()
+        files = get_files("common/religion/religions/")
+        rows, items, trait_rows, religion_doctrines, religion_men_at_arms = [], [], [], {}, {}
         for file in tqdm(files, desc="Religions"):
             subdata = all_data[file]
             for group_key, group in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
@@ -1226,68 +1306,71 @@ class Command(BaseCommand):
                     continue
                 group_doctrines = set(group.get("doctrine") or [])
                 for key, item in group.get("faiths", {}).items():
-                    if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                    item, duplicated = merge_item(item)
+                    if duplicated:
                         logger.warning(f'Duplicated religion "{key}"')
-                        all_duplicates.setdefault(Religion._meta.object_name, []).append(key)
-                        item = {k: v for d in item for k, v in d.items()}
+                        all_duplicates[Religion._meta.object_name].append(key)
                     if not isinstance(item, dict):
                         logger.debug(f'Unexpected data for religion "{key}": "{item}"')
                         continue
-                    religion, created = Religion.objects.import_update_or_create(
-                        id=key,
-                        defaults=dict(
-                            name=get_locale(key) or get_locale(f"{key}_name"),
-                            description=get_locale(f"{key}_desc"),
-                            group=group_key,
-                            color=convert_color(item.get("color")),
-                            # religious_head=get_object(Title, item.get("religious_head")),
-                            raw_data=item,
-                            exists=True,
-                        ),
+                    rows.append(
+                        (
+                            dict(id=key),
+                            dict(
+                                name=get_name(key),
+                                description=get_locale(f"{key}_desc"),
+                                group=group_key,
+                                color=convert_color(item.get("color")),
+                                # religious_head=get_object(Title, item.get("religious_head")),
+                                raw_data=get_raw_data(item),
+                                exists=True,
+                            ),
+                        )
                     )
-                    keep_object(Religion, religion)
-                    count += 1
-                    religion.created = created
-                    if religion.wip:
-                        continue
-                    # Religion doctrines
-                    doctrines = group_doctrines.copy()
-                    for doctrine in item.get("doctrine") or ():
-                        for name, values in doctrines_by_group.items():
-                            if "tenets" in name or doctrine not in values:
-                                continue
-                            doctrines -= values
-                            doctrines.add(doctrine)
-                            break
-                    if doctrines:
-                        religion.doctrines.set([get_object(Doctrine, doctrine) for doctrine in doctrines])
-                    # Religion traits
-                    if traits := group.get("traits"):
-                        for trait_type, values in traits.items():
-                            values = values.items() if isinstance(values, dict) else ((val, 1) for val in values)
-                            for trait, piety in values:
-                                religion_trait, _ = ReligionTrait.objects.update_or_create(
-                                    religion=religion,
-                                    trait=get_object(Trait, trait),
-                                    defaults=dict(
-                                        is_virtue=trait_type == "virtues",
-                                        piety=piety,
-                                    ),
-                                )
-                                keep_object(ReligionTrait, religion_trait)
-                    # Religion men-at-arms
-                    if men_at_arms := group.get("holy_order_maa"):
-                        men_at_arms = men_at_arms if isinstance(men_at_arms, list) else [men_at_arms]
-                        religion.men_at_arms.set([get_object(MenAtArms, maa) for maa in men_at_arms])
+                    items.append((group, group_doctrines, item))
+        for (group, group_doctrines, item), (religion, created) in zip(
+            items, Religion.objects.import_bulk_update_or_create(rows)
+        ):
+            keep_object(Religion, religion)
+            count += 1
+            religion.created = created
+            if religion.wip:
+                continue
+            # Religion doctrines
+            doctrines = group_doctrines.copy()
+            for doctrine in item.get("doctrine") or ():
+                if values := doctrine_groups.get(doctrine):
+                    doctrines -= values
+                    doctrines.add(doctrine)
+            if doctrines:
+                religion_doctrines[religion] = [get_object(Doctrine, doctrine) for doctrine in doctrines]
+            # Religion traits
+            if traits := group.get("traits"):
+                for trait_type, values in traits.items():
+                    values = values.items() if isinstance(values, dict) else ((val, 1) for val in values)
+                    for trait, piety in values:
+                        trait_rows.append(
+                            (
+                                dict(religion=religion, trait=get_object(Trait, trait)),
+                                dict(
+                                    is_virtue=trait_type == "virtues",
+                                    piety=piety,
+                                ),
+                            )
+                        )
+            # Religion men-at-arms
+            if men_at_arms := group.get("holy_order_maa"):
+                men_at_arms = men_at_arms if isinstance(men_at_arms, list) else [men_at_arms]
+                religion_men_at_arms[religion] = [get_object(MenAtArms, maa) for maa in men_at_arms]
+        for religion_trait, _ in ReligionTrait.objects.import_bulk_update_or_create(trait_rows):
+            keep_object(ReligionTrait, religion_trait)
+        bulk_set_relations(Religion.doctrines, religion_doctrines)
+        bulk_set_relations(Religion.men_at_arms, religion_men_at_arms)
         mark_as_done(Religion, count, start_date)
 
         # Province terrains
         province_terrains, default_terrain = {}, ""
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/province_terrain/"):
-                continue
-            files.append(file)
+        files = get_files("common/province_terrain/")
         for file in tqdm(files, desc="Province terrains"):
             subdata = all_data[file]
             default_terrain = subdata.get("default")
@@ -1296,7 +1379,7 @@ class Command(BaseCommand):
                     continue
                 if isinstance(item, list):
                     logger.warning(f'Duplicated province "{key}"')
-                    all_duplicates.setdefault(Province._meta.object_name, []).append(key)
+                    all_duplicates[Province._meta.object_name].append(key)
                     if all(isinstance(i, dict) for i in item):
                         item = {k: v for d in item for k, v in d.items()}
                     else:
@@ -1306,37 +1389,45 @@ class Command(BaseCommand):
                 province_terrain = province_terrains.setdefault(str(key), {})
                 province_terrain.update(item)
 
-        provinces = {}
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/provinces/"):
-                continue
+        provinces, province_histories = {}, {}
+        for file in get_files("history/provinces/"):
+            subdata = all_data[file]
             for key, item in subdata.items():
-                provinces[key] = item
+                provinces[key], province_histories[key] = {}, []
+                for subkey, subitem in item.items():
+                    if subkey[:1].isdigit() and match_date(subkey):
+                        province_histories[key].append((subkey, subitem))
+                    else:
+                        provinces[key][subkey] = subitem
+
+        def walk_titles(titles):
+            match_title = regex_title.match
+            stack = [(None, titles, None, False)]
+            while stack:
+                key, item, liege_key, done = stack.pop()
+                if done:
+                    yield key, item, liege_key
+                    continue
+                copy, subtitles = {}, []
+                for subkey, subitem in item.items():
+                    if match_title(subkey):
+                        subtitles.append((subkey, subitem, key, False))
+                    else:
+                        copy[subkey] = subitem
+                if key:
+                    stack.append((key, copy, liege_key, True))
+                stack.extend(reversed(subtitles))
 
-        def walk_titles(titles, from_key=None, prev_key=None):
-            copy = titles.copy()
-            for key, value in titles.items():
-                if regex_title.match(key):
-                    del copy[key]
-                    yield from walk_titles(value, from_key=key, prev_key=from_key)
-            if from_key:
-                yield from_key, copy, prev_key
+        landed_titles = {file: list(walk_titles(all_data[file])) for file in get_files("common/landed_titles/")}
 
         # Provinces
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/landed_titles/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Provinces"):
-            subdata = all_data[file]
-            total = len({key for key, *_ in walk_titles(subdata)})
-            all_titles = tqdm(walk_titles(subdata), total=total, desc=os.path.basename(file), leave=False)
+        rows = []
+        for file, titles in tqdm(landed_titles.items(), desc="Provinces"):
+            all_titles = tqdm(titles, desc=os.path.basename(file), leave=False)
             for key, item, liege_key in all_titles:
                 if province_id := item.get("province"):
                     province_data = provinces.get(str(province_id)) or {}
-                    province_data = {k: v for k, v in province_data.items() if not regex_date.fullmatch(k)}
                     terrain, winter_severity_bias = default_terrain, None
                     if province_terrain := province_terrains.get(str(province_id)):
                         terrain, winter_severity_bias = (
@@ -1344,41 +1435,45 @@ class Command(BaseCommand):
                             get_value(province_terrain, "winter_severity_bias"),
                         )
                     title_prefix = get_locale(f"{key}_article")
-                    title_name = get_locale(key) or get_locale(f"{key}_name")
+                    title_name = get_name(key)
                     if title_prefix and title_name:
                         title_name = f"{title_prefix} {title_name}"
-                    province, created = Province.objects.import_update_or_create(
-                        id=province_id,
-                        defaults=dict(
-                            name=title_name,
-                            culture=get_object(Culture, province_data.get("culture")),
-                            religion=get_object(Religion, province_data.get("religion")),
-                            holding=get_object(Holding, province_data.get("holding")),
-                            special_building_slot=get_object(Building, province_data.get("special_building_slot")),
-                            special_building=get_object(Building, province_data.get("special_building")),
-                            terrain=get_object(Terrain, terrain),
-                            winter_severity_bias=winter_severity_bias,
-                            raw_data=province_data or None,
-                            exists=True,
-                        ),
+                    rows.append(
+                        (
+                            dict(id=province_id),
+                            dict(
+                                name=title_name,
+                                culture=get_object(Culture, province_data.get("culture")),
+                                religion=get_object(Religion, province_data.get("religion")),
+                                holding=get_object(Holding, province_data.get("holding")),
+                                special_building_slot=get_object(Building, province_data.get("special_building_slot")),
+                                special_building=get_object(Building, province_data.get("special_building")),
+                                terrain=get_object(Terrain, terrain),
+                                winter_severity_bias=winter_severity_bias,
+                                raw_data=get_raw_data(province_data or None),
+                                exists=True,
+                            ),
+                        )
                     )
-                    keep_object(Province, province)
-                    count += 1
-                    province.created = created
+        for province, created in Province.objects.import_bulk_update_or_create(rows):
+            keep_object(Province, province)
+            count += 1
+            province.created = created
         mark_as_done(Province, count, start_date)
 
         # Province history
         histories = {}
         count, start_date = 0, datetime.datetime.now()
-        for key, item in tqdm(provinces.items(), desc="Province history"):
-            for date, subitem in item.items():
-                if date := regex_date.fullmatch(date) and convert_date(date, key):
-                    pdx_date = to_pdx_date(date)
-                    if isinstance(subitem, list):
+        rows, items, history_buildings = [], [], {}
+        for key, item in tqdm(province_histories.items(), desc="Province history"):
+            for date, subitem in item:
+                date, pdx_date = get_date(date, key)
+                if date:
+                    if type(subitem) is list:
                         logger.warning(f'Duplicated province history "{key}" for "{pdx_date}"')
-                        all_duplicates.setdefault(ProvinceHistory._meta.object_name, []).append((key, pdx_date))
+                        all_duplicates[ProvinceHistory._meta.object_name].append((key, pdx_date))
                         subitem = {k: v for d in subitem for k, v in d.items()}
-                    if not isinstance(subitem, dict):
+                    if type(subitem) is not dict:
                         continue
                     province = get_object(Province, key)
                     if province.wip:
@@ -1387,117 +1482,123 @@ class Command(BaseCommand):
                         logger.warning(f'Duplicated province history "{key}" for "{pdx_date}" in different files')
                         subitem = {**previous_history, **subitem}
                     histories[key, date] = subitem
-                    province_history, created = ProvinceHistory.objects.update_or_create(
-                        province=province,
-                        date=date,
-                        defaults=dict(
-                            holding=get_object(Holding, subitem.get("holding")),
-                            culture=get_object(Culture, subitem.get("culture")),
-                            religion=get_object(Religion, subitem.get("religion")),
-                            raw_data=subitem,
-                        ),
+                    rows.append(
+                        (
+                            dict(province=province, date=date),
+                            dict(
+                                holding=get_object(Holding, subitem.get("holding")),
+                                culture=get_object(Culture, subitem.get("culture")),
+                                religion=get_object(Religion, subitem.get("religion")),
+                                raw_data=get_raw_data(subitem),
+                            ),
+                        )
                     )
-                    if buildings := subitem.get("buildings"):
-                        buildings = buildings if isinstance(buildings, list) else [buildings]
-                        province_history.buildings.set([get_object(Building, building) for building in buildings])
-                    keep_object(ProvinceHistory, province_history, warning=False)
-                    count += 1
-                    province_history.created = created
+                    items.append(subitem)
+        for subitem, (province_history, created) in zip(
+            items, ProvinceHistory.objects.import_bulk_update_or_create(rows)
+        ):
+            if buildings := subitem.get("buildings"):
+                buildings = buildings if isinstance(buildings, list) else [buildings]
+                history_buildings[province_history] = [get_object(Building, building) for building in buildings]
+            keep_object(ProvinceHistory, province_history, warning=False)
+            count += 1
+            province_history.created = created
+        bulk_set_relations(ProvinceHistory.buildings, history_buildings)
         mark_as_done(ProvinceHistory, count, start_date)
+        free_files("history/provinces/", "common/province_terrain/")
+        del provinces, province_histories, province_terrains
 
         # Titles
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/landed_titles/"):
-                continue
-            files.append(file)
-        for file in tqdm(files, desc="Titles"):
-            subdata = all_data[file]
-            total = len({key for key, *_ in walk_titles(subdata)})
-            all_titles = tqdm(walk_titles(subdata), total=total, desc=os.path.basename(file), leave=False)
+        province_titles = {title.province_id: title for title in Title.objects.filter(province__isnull=False)}
+        title_keys = {key for titles in landed_titles.values() for key, item, liege_key in titles}
+        for file, titles in tqdm(landed_titles.items(), desc="Titles"):
+            all_titles = tqdm(titles, desc=os.path.basename(file), leave=False)
+            rows, province_rows = [], {}
             for key, item, liege_key in all_titles:
                 province = get_object(Province, item.get("province"))
-                try:
-                    if province and province.title.id != key:
-                        logger.warning(
-                            f'Province "{province}" ({province.id}) is already related to '
-                            f'title "{province.title}" ({province.title.id}) and will be deleted'
-                        )
-                        province_title = province.title
-                        province_title.province = None
-                        province_title.save(update_fields=("province",))
-                except:  # noqa
-                    pass
-                title, created = Title.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        prefix=get_locale(f"{key}_article"),
-                        tier=title_tiers.get(key.split("_")[0]),
-                        color=convert_color(item.get("color")),
-                        province=get_object(Province, item.get("province")),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                if province and (province_title := province_titles.get(province.pk)) and province_title.id != key:
+                    logger.warning(
+                        f'Province "{province}" ({province.id}) is already related to '
+                        f'title "{province_title}" ({province_title.id}) and will be deleted'
+                    )
+                    province_title.province = None
+                    province_title.save(update_fields=("province",))
+                    del province_titles[province.pk]
+                if province and (province_row := province_rows.get(province.pk)) and province_row[0]["id"] != key:
+                    logger.warning(
+                        f'Province "{province}" ({province.id}) is already related to '
+                        f'title "{province_row[0]["id"]}" and will be deleted'
+                    )
+                    province_row[1]["province"] = None
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            prefix=get_locale(f"{key}_article"),
+                            tier=title_tiers.get(key.split("_")[0]),
+                            color=convert_color(item.get("color")),
+                            province=province,
+                            de_jure_liege_id=liege_key,
+                            capital_id=get_object_id(Title, item.get("capital"), title_keys),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
+                if province:
+                    province_rows[province.pk] = rows[-1]
+            for title, created in Title.objects.import_bulk_update_or_create(rows):
                 keep_object(Title, title)
                 count += 1
                 title.created = created
-            for key, item, liege_key in walk_titles(subdata):
-                title = get_object(Title, key)
-                if title.wip:
-                    continue
-                title.de_jure_liege = get_object(Title, liege_key)
-                title.capital = get_object(Title, item.get("capital"))
-                if title.modified:
-                    title.save()
+                if title.province_id:
+                    province_titles[title.province_id] = title
         mark_as_done(Title, count, start_date)
+        free_files("common/landed_titles/")
+        del landed_titles, title_keys
 
         # Holy sites
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/religion/holy_sites/"):
-                continue
-            files.append(file)
+        files = get_files("common/religion/holy_sites/")
+        rows = []
         for file in tqdm(files, desc="Holy sites"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated holy site "{key}"')
-                    all_duplicates.setdefault(HolySite._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[HolySite._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for holy site "{key}": "{item}"')
                     continue
-                holy_site, created = HolySite.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        county=get_object(Title, item.get("county")),
-                        barony=get_object(Title, item.get("barony")),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            county=get_object(Title, item.get("county")),
+                            barony=get_object(Title, item.get("barony")),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(HolySite, holy_site)
-                count += 1
-                holy_site.created = created
+        for holy_site, created in HolySite.objects.import_bulk_update_or_create(rows):
+            keep_object(HolySite, holy_site)
+            count += 1
+            holy_site.created = created
         # Holy site and religious head in religions
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/religion/religions/"):
-                continue
-            files.append(file)
+        religion_holy_sites, religious_heads = {}, []
+        files = get_files("common/religion/religions/")
         for file in tqdm(files, desc="Religious heads/sites"):
             subdata = all_data[file]
             for group_key, group in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
                 if not group or not isinstance(group, dict):
                     continue
                 for key, item in group.get("faiths", {}).items():
-                    if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                        item = {k: v for d in item for k, v in d.items()}
+                    item, _ = merge_item(item)
                     if not isinstance(item, dict):
                         continue
                     religion = get_object(Religion, key)
@@ -1505,347 +1606,300 @@ class Command(BaseCommand):
                         continue
                     if holy_sites := item.get("holy_site"):
                         holy_sites = holy_sites if isinstance(holy_sites, list) else [holy_sites]
-                        religion.holy_sites.set([get_object(HolySite, holy_site) for holy_site in holy_sites])
+                        religion_holy_sites[religion] = [get_object(HolySite, holy_site) for holy_site in holy_sites]
                     if religious_head := item.get("religious_head"):
                         religion.religious_head = get_object(Title, religious_head)
-                        if religion.modified:
-                            religion.save()
+                        religious_heads.append(religion)
+        bulk_set_relations(Religion.holy_sites, religion_holy_sites)
+        Religion.objects.import_bulk_update(religious_heads)
         mark_as_done(HolySite, count, start_date)
 
         # Nicknames
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/nicknames/"):
-                continue
-            files.append(file)
+        files = get_files("common/nicknames/")
+        rows = []
         for file in tqdm(files, desc="Nicknames"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated nickname "{key}"')
-                    all_duplicates.setdefault(Nickname._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Nickname._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for nickname "{key}": "{item}"')
                     continue
-                nickname, created = Nickname.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        description=get_locale(f"{key}_desc"),
-                        is_bad=item.get("is_bad", False),
-                        is_prefix=item.get("is_prefix", False),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            description=get_locale(f"{key}_desc"),
+                            is_bad=item.get("is_bad", False),
+                            is_prefix=item.get("is_prefix", False),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Nickname, nickname)
-                count += 1
-                nickname.created = created
+        for nickname, created in Nickname.objects.import_bulk_update_or_create(rows):
+            keep_object(Nickname, nickname)
+            count += 1
+            nickname.created = created
         mark_as_done(Nickname, count, start_date)
 
         # Death reasons
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/deathreasons/"):
-                continue
-            files.append(file)
+        files = get_files("common/deathreasons/")
+        rows = []
         for file in tqdm(files, desc="Death reasons"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated death reason "{key}"')
-                    all_duplicates.setdefault(DeathReason._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[DeathReason._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for death reason "{key}": "{item}"')
                     continue
-                death_reason, created = DeathReason.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(key) or get_locale(f"{key}_name"),
-                        is_default=item.get("default", False),
-                        is_natural=item.get("natural", False),
-                        is_public_knowledge=item.get("public_knowledge"),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_name(key),
+                            is_default=item.get("default", False),
+                            is_natural=item.get("natural", False),
+                            is_public_knowledge=item.get("public_knowledge"),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(DeathReason, death_reason)
-                count += 1
-                death_reason.created = created
+        for death_reason, created in DeathReason.objects.import_bulk_update_or_create(rows):
+            keep_object(DeathReason, death_reason)
+            count += 1
+            death_reason.created = created
         mark_as_done(DeathReason, count, start_date)
 
         # Coat of Arms
-        coat_of_arms = {}
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/coat_of_arms/coat_of_arms/"):
-                continue
-            coat_of_arms.update(subdata)
+        coat_of_arms = collections.ChainMap(
+            *(all_data[file] for file in reversed(get_files("common/coat_of_arms/coat_of_arms/")))
+        )
 
         # Dynasties
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/dynasties/"):
-                continue
-            files.append(file)
+        files = get_files("common/dynasties/")
+        rows = []
         for file in tqdm(files, desc="Dynasties"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated dynasty "{key}"')
-                    all_duplicates.setdefault(Dynasty._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Dynasty._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for dynasty "{key}": "{item}"')
                     continue
-                dynasty, created = Dynasty.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(item.get("name")),
-                        prefix=get_locale(item.get("prefix")),
-                        description=get_locale(item.get("motto")),
-                        culture=get_object(Culture, item.get("culture")),
-                        coa_data=coat_of_arms.get(key),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_locale(item.get("name")),
+                            prefix=get_locale(item.get("prefix")),
+                            description=get_locale(item.get("motto")),
+                            culture=get_object(Culture, item.get("culture")),
+                            coa_data=coat_of_arms.get(key),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Dynasty, dynasty)
-                count += 1
-                dynasty.created = created
+        for dynasty, created in Dynasty.objects.import_bulk_update_or_create(rows):
+            keep_object(Dynasty, dynasty)
+            count += 1
+            dynasty.created = created
         mark_as_done(Dynasty, count, start_date)
 
         # Houses
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/dynasty_houses/"):
-                continue
-            files.append(file)
+        files = get_files("common/dynasty_houses/")
+        rows = []
         for file in tqdm(files, desc="Houses"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated house "{key}"')
-                    all_duplicates.setdefault(House._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[House._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for house "{key}": "{item}"')
                     continue
-                house, created = House.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(item.get("name")),
-                        prefix=get_locale(item.get("prefix")),
-                        description=get_locale(item.get("motto")),
-                        dynasty=get_object(Dynasty, item.get("dynasty")),
-                        coa_data=coat_of_arms.get(key),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_locale(item.get("name")),
+                            prefix=get_locale(item.get("prefix")),
+                            description=get_locale(item.get("motto")),
+                            dynasty=get_object(Dynasty, item.get("dynasty")),
+                            coa_data=coat_of_arms.get(key),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(House, house)
-                count += 1
-                house.created = created
+        for house, created in House.objects.import_bulk_update_or_create(rows):
+            keep_object(House, house)
+            count += 1
+            house.created = created
         mark_as_done(House, count, start_date)
+        free_files("common/coat_of_arms/coat_of_arms/")
+        del coat_of_arms
 
         # DNA
-        dna = {}
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("common/dna_data/"):
-                continue
-            dna.update(subdata)
+        dna = collections.ChainMap(*(all_data[file] for file in reversed(get_files("common/dna_data/"))))
 
         # Characters
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/characters/"):
-                continue
-            files.append(file)
+        files = get_files("history/characters/")
+        characters, character_traits = [], {}
+        rows = []
         for file in tqdm(files, desc="Characters"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated character "{key}"')
-                    all_duplicates.setdefault(Character._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Character._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for character "{key}": "{item}"')
                     continue
-                item = {k: v for k, v in item.items() if not regex_date.fullmatch(k)}
+                static_item, dates = {}, []
+                for subkey, subitem in item.items():
+                    if subkey[:1].isdigit() and match_date(subkey):
+                        dates.append((subkey, subitem))
+                    else:
+                        static_item[subkey] = subitem
+                item = static_item
+                characters.append((key, item, dates))
                 house = get_object(House, item.get("dynasty_house"))
                 dynasty = get_object(Dynasty, item.get("dynasty"))
-                dynasty = dynasty or (house.dynasty if house else None)
-                character, created = Character.objects.import_update_or_create(
-                    id=key,
-                    defaults=dict(
-                        name=get_locale(item.get("name"), keep=True),
-                        gender="F" if item.get("female") else "M",
-                        sexuality=item.get("sexuality", ""),
-                        random_traits=not item.get("disallow_random_traits", False),
-                        dynasty=dynasty,
-                        house=house,
-                        nickname=get_object(Nickname, item.get("give_nickname")),
-                        culture=get_object(Culture, item.get("culture")),
-                        religion=get_object(Religion, item.get("religion")),
-                        diplomacy=get_value(item, "diplomacy"),
-                        martial=get_value(item, "martial"),
-                        stewardship=get_value(item, "stewardship"),
-                        intrigue=get_value(item, "intrigue"),
-                        learning=get_value(item, "learning"),
-                        prowess=get_value(item, "prowess"),
-                        gold=get_value(item, "add_gold"),
-                        prestige=get_value(item, "add_prestige"),
-                        piety=get_value(item, "add_piety"),
-                        dna_data=dna.get(item.get("dna")) or dna.get(key),
-                        raw_data=item,
-                        exists=True,
-                    ),
+                if not dynasty and house and house.dynasty_id:
+                    dynasty = all_objects[Dynasty].get(house.dynasty_id) or house.dynasty
+                rows.append(
+                    (
+                        dict(id=key),
+                        dict(
+                            name=get_locale(item.get("name"), keep=True),
+                            gender="F" if item.get("female") else "M",
+                            sexuality=item.get("sexuality", ""),
+                            random_traits=not item.get("disallow_random_traits", False),
+                            dynasty=dynasty,
+                            house=house,
+                            nickname=get_object(Nickname, item.get("give_nickname")),
+                            culture=get_object(Culture, item.get("culture")),
+                            religion=get_object(Religion, item.get("religion")),
+                            diplomacy=get_value(item, "diplomacy"),
+                            martial=get_value(item, "martial"),
+                            stewardship=get_value(item, "stewardship"),
+                            intrigue=get_value(item, "intrigue"),
+                            learning=get_value(item, "learning"),
+                            prowess=get_value(item, "prowess"),
+                            gold=get_value(item, "add_gold"),
+                            prestige=get_value(item, "add_prestige"),
+                            piety=get_value(item, "add_piety"),
+                            dna_data=dna.get(item.get("dna")) or dna.get(key),
+                            raw_data=get_raw_data(item),
+                            exists=True,
+                        ),
+                    )
                 )
-                keep_object(Character, character)
-                count += 1
-                character.created = created
-                if character.wip:
-                    continue
-                if traits := item.get("trait"):
-                    traits = traits if isinstance(traits, list) else [traits]
-                    character.traits.set([get_object(Trait, trait) for trait in traits])
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/characters/"):
+        character_keys = {str(key) for key, item, dates in characters}
+        for (key, item, dates), (lookups, defaults) in zip(characters, rows):
+            if "father" in item or "mother" in item:
+                defaults.update(
+                    father_id=get_object_id(Character, item.get("father"), character_keys),
+                    mother_id=get_object_id(Character, item.get("mother"), character_keys),
+                )
+        for index, (character, created) in enumerate(Character.objects.import_bulk_update_or_create(rows)):
+            key, item, dates = characters[index]
+            characters[index] = key, item, dates, character
+            keep_object(Character, character)
+            count += 1
+            character.created = created
+            if character.wip:
                 continue
-            for key, item in subdata.items():
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict):
-                    continue
-                if "father" in item or "mother" in item:
-                    character = get_object(Character, key)
-                    if character.wip:
-                        continue
-                    character.father = get_object(Character, item.get("father"))
-                    character.mother = get_object(Character, item.get("mother"))
-                    if character.modified:
-                        character.save()
+            if traits := item.get("trait"):
+                traits = traits if isinstance(traits, list) else [traits]
+                character_traits[character] = [get_object(Trait, trait) for trait in dict.fromkeys(traits)]
+        bulk_set_relations(Character.traits, character_traits)
         mark_as_done(Character, count, start_date)
 
         # Character history
         histories = {}
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/characters/"):
+        relations_fk = (
+            ("add_soulmate", "set_relation_soulmate"),
+            ("remove_soulmate", "remove_relation_soulmate"),
+            ("add_best_friend", "set_relation_best_friend"),
+            ("remove_best_friend", "remove_relation_best_friend"),
+            ("add_nemesis", "set_relation_nemesis"),
+            ("remove_nemesis", "remove_relation_nemesis"),
+            ("add_guardian", "set_relation_guardian"),
+            ("remove_guardian", "remove_relation_guardian"),
+        )
+        rows, items = [], []
+        for key, item, dates, character in tqdm(characters, desc="Character history"):
+            if character.wip:
                 continue
-            files.append(file)
-        for file in tqdm(files, desc="Character history"):
-            subdata = all_data[file]
-            for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
-                    item = {k: v for d in item for k, v in d.items()}
-                if not isinstance(item, dict):
-                    continue
-                character = get_object(Character, key)
-                if character.wip:
-                    continue
-                for date, subitem in item.items():
-                    if date := regex_date.fullmatch(date) and convert_date(date, key):
-                        pdx_date = to_pdx_date(date)
-                        if isinstance(subitem, list):
-                            logger.warning(f'Duplicated character history "{key}" for "{pdx_date}"')
-                            all_duplicates.setdefault(CharacterHistory._meta.object_name, []).append((key, pdx_date))
-                            subitem = {k: v for i in subitem for k, v in i.items() if isinstance(i, dict)}
-                        if not subitem:
-                            continue
-                        if previous_history := histories.get((key, date)):
-                            logger.warning(f'Duplicated character history "{key}" for "{pdx_date}" in different files')
-                            subitem = {**previous_history, **subitem}
-                        histories[key, date] = subitem
-                        effect = subitem.get("effect", {})
-                        if isinstance(effect, list):
-                            effect = {k: v for i in effect for k, v in i.items()}
-                        if culture := effect.get("set_culture"):
-                            scope, culture = culture.split(":")
-                            culture = get_object(Culture, culture) if scope == "culture" else None
-                        event = "other"
-                        if subitem.get("birth"):
-                            event = "birth"
-                            character.birth_date = date
-                        if death := subitem.get("death"):
-                            event = "death"
-                            character.death_date = date
-                            if isinstance(death, dict):
-                                character.death_reason = get_object(DeathReason, death.get("death_reason"))
-                                character.killer = get_object(Character, death.get("killer"))
-                        employer, is_unemployed = None, (subitem.get("employer") == 0) or None
-                        if not is_unemployed:
-                            employer = get_object(Character, subitem.get("employer"))
-                            is_unemployed = False if employer else is_unemployed
-                        if add_soulmate := effect.get("set_relation_soulmate"):
-                            if isinstance(add_soulmate, dict):
-                                add_soulmate = add_soulmate.get("target")
-                            scope, add_soulmate = add_soulmate.split(":")
-                            add_soulmate = get_object(Character, add_soulmate) if scope == "character" else None
-                        if rem_soulmate := effect.get("remove_relation_soulmate"):
-                            if isinstance(rem_soulmate, dict):
-                                rem_soulmate = rem_soulmate.get("target")
-                            scope, rem_soulmate = rem_soulmate.split(":")
-                            rem_soulmate = get_object(Character, rem_soulmate) if scope == "character" else None
-                        if add_best_friend := effect.get("set_relation_best_friend"):
-                            if isinstance(add_best_friend, dict):
-                                add_best_friend = add_best_friend.get("target")
-                            scope, add_best_friend = add_best_friend.split(":")
-                            add_best_friend = get_object(Character, add_best_friend) if scope == "character" else None
-                        if rem_best_friend := effect.get("remove_relation_best_friend"):
-                            if isinstance(rem_best_friend, dict):
-                                rem_best_friend = rem_best_friend.get("target")
-                            scope, rem_best_friend = rem_best_friend.split(":")
-                            rem_best_friend = get_object(Character, rem_best_friend) if scope == "character" else None
-                        if add_nemesis := effect.get("set_relation_nemesis"):
-                            if isinstance(add_nemesis, dict):
-                                add_nemesis = add_nemesis.get("target")
-                            scope, add_nemesis = add_nemesis.split(":")
-                            add_nemesis = get_object(Character, add_nemesis) if scope == "character" else None
-                        if rem_nemesis := effect.get("remove_relation_nemesis"):
-                            if isinstance(rem_nemesis, dict):
-                                rem_nemesis = rem_nemesis.get("target")
-                            scope, rem_nemesis = rem_nemesis.split(":")
-                            rem_nemesis = get_object(Character, rem_nemesis) if scope == "character" else None
-                        if add_guardian := effect.get("set_relation_guardian"):
-                            if isinstance(add_guardian, dict):
-                                add_guardian = add_guardian.get("target")
-                            scope, add_guardian = add_guardian.split(":")
-                            add_guardian = get_object(Character, add_guardian) if scope == "character" else None
-                        if rem_guardian := effect.get("remove_relation_guardian"):
-                            if isinstance(rem_guardian, dict):
-                                rem_guardian = rem_guardian.get("target")
-                            scope, rem_guardian = rem_guardian.split(":")
-                            rem_guardian = get_object(Character, rem_guardian) if scope == "character" else None
-                        history, created = CharacterHistory.objects.update_or_create(
-                            character=character,
-                            date=date,
-                            defaults=dict(
+            for date, subitem in dates:
+                date, pdx_date = get_date(date, key)
+                if date:
+                    if type(subitem) is list:
+                        logger.warning(f'Duplicated character history "{key}" for "{pdx_date}"')
+                        all_duplicates[CharacterHistory._meta.object_name].append((key, pdx_date))
+                        subitem = {k: v for i in subitem for k, v in i.items() if isinstance(i, dict)}
+                    if not subitem:
+                        continue
+                    if previous_history := histories.get((key, date)):
+                        logger.warning(f'Duplicated character history "{key}" for "{pdx_date}" in different files')
+                        subitem = {**previous_history, **subitem}
+                    histories[key, date] = subitem
+                    effect = subitem.get("effect", {})
+                    if type(effect) is list:
+                        effect = effect[0] if len(effect) == 1 else collections.ChainMap(*reversed(effect))
+                    culture = get_scoped_object(Culture, effect.get("set_culture"), "culture")
+                    event = "other"
+                    if subitem.get("birth"):
+                        event = "birth"
+                        character.birth_date = date
+                    if death := subitem.get("death"):
+                        event = "death"
+                        character.death_date = date
+                        if type(death) is dict:
+                            character.death_reason = get_object(DeathReason, death.get("death_reason"))
+                            character.killer = get_object(Character, death.get("killer"))
+                    employer, is_unemployed = None, (subitem.get("employer") == 0) or None
+                    if not is_unemployed:
+                        employer = get_object(Character, subitem.get("employer"))
+                        is_unemployed = False if employer else is_unemployed
+                    relations = {}
+                    for field, relation in relations_fk:
+                        relations[field] = get_scoped_object(Character, effect.get(relation), "character")
+                    rows.append(
+                        (
+                            dict(character=character, date=date),
+                            dict(
                                 event=event,
                                 is_unemployed=is_unemployed,
                                 employer=employer,
                                 add_spouse=get_object(Character, subitem.get("add_spouse")),
                                 add_matrilineal_spouse=get_object(Character, subitem.get("add_matrilineal_spouse")),
                                 remove_spouse=get_object(Character, subitem.get("remove_spouse")),
-                                add_soulmate=add_soulmate,
-                                remove_soulmate=rem_soulmate,
-                                add_best_friend=add_best_friend,
-                                remove_best_friend=rem_best_friend,
-                                add_nemesis=add_nemesis,
-                                remove_nemesis=rem_nemesis,
-                                add_guardian=add_guardian,
-                                remove_guardian=rem_guardian,
+                                **relations,
                                 dynasty=get_object(Dynasty, subitem.get("dynasty")),
                                 house=get_object(House, effect.get("set_house")),
                                 nickname=get_object(Nickname, subitem.get("give_nickname")),
-                                culture=culture or None,
+                                culture=culture,
                                 religion=get_object(Religion, subitem.get("religion") or subitem.get("faith")),
                                 diplomacy=get_value(subitem, "diplomacy"),
                                 martial=get_value(subitem, "martial"),
@@ -1856,59 +1910,64 @@ class Command(BaseCommand):
                                 gold=get_value(subitem, "add_gold") or effect.get("add_gold"),
                                 prestige=get_value(subitem, "add_prestige") or effect.get("add_prestige"),
                                 piety=get_value(subitem, "add_piety") or effect.get("add_piety"),
-                                raw_data=subitem,
+                                raw_data=get_raw_data(subitem),
                             ),
                         )
-                        keep_object(CharacterHistory, history, warning=False)
-                        count += 1
-                        history.created = created
-                        relations_m2m = (
-                            ("set_relation_lover", history.add_lovers),
-                            ("remove_relation_lover", history.remove_lovers),
-                            ("set_relation_potential_friend", history.add_potential_friends),
-                            ("remove_relation_potential_friend", history.remove_potential_friends),
-                            ("set_relation_friend", history.add_friends),
-                            ("remove_relation_friend", history.remove_friends),
-                            ("set_relation_potential_rival", history.add_potential_rivals),
-                            ("remove_relation_potential_rival", history.remove_potential_rivals),
-                            ("set_relation_rival", history.add_rivals),
-                            ("remove_relation_rival", history.remove_rivals),
-                        )
-                        for relation, field in relations_m2m:
-                            if targets := effect.get(relation):
-                                values = []
-                                for target in targets if isinstance(targets, list) else [targets]:
-                                    if isinstance(target, dict):
-                                        target = target.get("target")
-                                    values.append(target.split(":"))
-                                field.set(
-                                    [get_object(Character, target) for scope, target in values if scope == "character"]
-                                )
-                        if traits := subitem.get("trait"):
-                            traits = traits if isinstance(traits, list) else [traits]
-                            history.traits_added.set([get_object(Trait, trait) for trait in traits])
-                        if traits := subitem.get("remove_trait"):
-                            traits = traits if isinstance(traits, list) else [traits]
-                            history.traits_removed.set([get_object(Trait, trait) for trait in traits])
-                if character.modified:
-                    character.save()
+                    )
+                    items.append((effect, subitem))
+        Character.objects.import_bulk_update(character for key, item, dates, character in characters)
+        relations_m2m = (
+            ("add_lovers", "set_relation_lover"),
+            ("remove_lovers", "remove_relation_lover"),
+            ("add_potential_friends", "set_relation_potential_friend"),
+            ("remove_potential_friends", "remove_relation_potential_friend"),
+            ("add_friends", "set_relation_friend"),
+            ("remove_friends", "remove_relation_friend"),
+            ("add_potential_rivals", "set_relation_potential_rival"),
+            ("remove_potential_rivals", "remove_relation_potential_rival"),
+            ("add_rivals", "set_relation_rival"),
+            ("remove_rivals", "remove_relation_rival"),
+        )
+        history_relations = {field: {} for field, relation in relations_m2m}
+        history_traits_added, history_traits_removed = {}, {}
+        for (effect, subitem), (history, created) in zip(
+            items, CharacterHistory.objects.import_bulk_update_or_create(rows)
+        ):
+            keep_object(CharacterHistory, history, warning=False)
+            count += 1
+            history.created = created
+            for field, relation in relations_m2m:
+                if targets := effect.get(relation):
+                    history_relations[field][history] = [
+                        get_scoped_object(Character, target, "character")
+                        for target in (targets if type(targets) is list else [targets])
+                    ]
+            if traits := subitem.get("trait"):
+                traits = traits if type(traits) is list else [traits]
+                history_traits_added[history] = [get_object(Trait, trait) for trait in dict.fromkeys(traits)]
+            if traits := subitem.get("remove_trait"):
+                traits = traits if type(traits) is list else [traits]
+                history_traits_removed[history] = [get_object(Trait, trait) for trait in dict.fromkeys(traits)]
+        for field, relations in history_relations.items():
+            bulk_set_relations(getattr(CharacterHistory, field), relations)
+        bulk_set_relations(CharacterHistory.traits_added, history_traits_added)
+        bulk_set_relations(CharacterHistory.traits_removed, history_traits_removed)
         mark_as_done(CharacterHistory, count, start_date)
+        free_files("history/characters/", "common/dna_data/")
+        del characters, character_keys, dna
 
         # Title history
         histories = {}
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/titles/"):
-                continue
-            files.append(file)
+        files = get_files("history/titles/")
+        rows, items = [], []
         for file in tqdm(files, desc="Title history"):
             subdata = all_data[file]
             for key, item in tqdm(subdata.items(), desc=os.path.basename(file), leave=False):
-                if isinstance(item, list) and all(isinstance(i, dict) for i in item):
+                item, duplicated = merge_item(item)
+                if duplicated:
                     logger.warning(f'Duplicated title "{key}"')
-                    all_duplicates.setdefault(Title._meta.object_name, []).append(key)
-                    item = {k: v for d in item for k, v in d.items()}
+                    all_duplicates[Title._meta.object_name].append(key)
                 if not isinstance(item, dict):
                     logger.debug(f'Unexpected data for title "{key}": "{item}"')
                     continue
@@ -1916,11 +1975,11 @@ class Command(BaseCommand):
                 if title.wip:
                     continue
                 for date, subitem in item.items():
-                    if date := regex_date.fullmatch(date) and convert_date(date, key):
-                        pdx_date = to_pdx_date(date)
-                        if isinstance(subitem, list):
+                    date, pdx_date = get_date(date, key)
+                    if date:
+                        if type(subitem) is list:
                             logger.warning(f'Duplicated title history "{key}" for "{pdx_date}"')
-                            all_duplicates.setdefault(TitleHistory._meta.object_name, []).append((key, pdx_date))
+                            all_duplicates[TitleHistory._meta.object_name].append((key, pdx_date))
                             subitem = {k: v for i in subitem for k, v in i.items() if isinstance(i, dict)}
                         if not subitem:
                             continue
@@ -1934,36 +1993,37 @@ class Command(BaseCommand):
                         holder, is_destroyed = None, (subitem.get("holder") == 0) or None
                         if not is_destroyed:
                             holder = get_object(Character, subitem.get("holder"))
-                        history, created = TitleHistory.objects.update_or_create(
-                            title=title,
-                            date=date,
-                            defaults=dict(
-                                de_jure_liege=get_object(Title, subitem.get("de_jure_liege")),
-                                liege=liege,
-                                holder=holder,
-                                is_independent=is_independent,
-                                is_destroyed=is_destroyed,
-                                development_level=get_value(subitem, "change_development_level"),
-                                raw_data=subitem,
-                            ),
-                        )
-                        keep_object(TitleHistory, history, warning=False)
-                        count += 1
-                        history.created = created
-                        if succession_laws := subitem.get("succession_laws"):
-                            succession_laws = (
-                                succession_laws if isinstance(succession_laws, list) else [succession_laws]
+                        rows.append(
+                            (
+                                dict(title=title, date=date),
+                                dict(
+                                    de_jure_liege=get_object(Title, subitem.get("de_jure_liege")),
+                                    liege=liege,
+                                    holder=holder,
+                                    is_independent=is_independent,
+                                    is_destroyed=is_destroyed,
+                                    development_level=get_value(subitem, "change_development_level"),
+                                    raw_data=get_raw_data(subitem),
+                                ),
                             )
-                            history.succession_laws.set([get_object(Law, law) for law in succession_laws])
+                        )
+                        items.append(subitem)
+        history_succession_laws = {}
+        for subitem, (history, created) in zip(items, TitleHistory.objects.import_bulk_update_or_create(rows)):
+            keep_object(TitleHistory, history, warning=False)
+            count += 1
+            history.created = created
+            if succession_laws := subitem.get("succession_laws"):
+                succession_laws = succession_laws if isinstance(succession_laws, list) else [succession_laws]
+                history_succession_laws[history] = [get_object(Law, law) for law in dict.fromkeys(succession_laws)]
+        bulk_set_relations(TitleHistory.succession_laws, history_succession_laws)
         mark_as_done(TitleHistory, count, start_date)
+        free_files("history/titles/")
 
         # Wars
         count, start_date = 0, datetime.datetime.now()
-        files = []
-        for file, subdata in all_data.items():
-            if not subdata or not file.startswith("history/wars/"):
-                continue
-            files.append(file)
+        files = get_files("history/wars/")
+        rows, items = [], []
         for file in tqdm(files, desc="Wars"):
             subdata = all_data[file]
             wars = subdata.get("war")
@@ -1971,39 +2031,49 @@ class Command(BaseCommand):
             for item in tqdm(wars, desc=os.path.basename(file), leave=False):
                 if not isinstance(item, dict) and not item.get("name"):
                     continue
-                war, created = War.objects.import_update_or_create(
-                    id=item.get("name"),
-                    defaults=dict(
-                        name=get_locale(item.get("name")),
-                        start_date=convert_date(item.get("start_date")),
-                        end_date=convert_date(item.get("end_date")),
-                        casus_belli=get_object(CasusBelli, item.get("casus_belli")),
-                        claimant=get_object(Character, item.get("claimant")),
-                    ),
+                rows.append(
+                    (
+                        dict(id=item.get("name")),
+                        dict(
+                            name=get_locale(item.get("name")),
+                            start_date=convert_date(item.get("start_date")),
+                            end_date=convert_date(item.get("end_date")),
+                            casus_belli=get_object(CasusBelli, item.get("casus_belli")),
+                            claimant=get_object(Character, item.get("claimant")),
+                        ),
+                    )
                 )
-                keep_object(War, war)
-                count += 1
-                war.created = created
-                if attackers := item.get("attackers"):
-                    war.attackers.set([get_object(Character, attacker) for attacker in attackers])
-                if defenders := item.get("defenders"):
-                    war.defenders.set([get_object(Character, defender) for defender in defenders])
-                if titles := item.get("targeted_titles"):
-                    war.targeted_titles.set([get_object(Title, title) for title in titles])
+                items.append(item)
+        war_attackers, war_defenders, war_titles = {}, {}, {}
+        for item, (war, created) in zip(items, War.objects.import_bulk_update_or_create(rows)):
+            keep_object(War, war)
+            count += 1
+            war.created = created
+            if attackers := item.get("attackers"):
+                war_attackers[war] = [get_object(Character, attacker) for attacker in attackers]
+            if defenders := item.get("defenders"):
+                war_defenders[war] = [get_object(Character, defender) for defender in defenders]
+            if titles := item.get("targeted_titles"):
+                war_titles[war] = [get_object(Title, title) for title in titles]
+        bulk_set_relations(War.attackers, war_attackers)
+        bulk_set_relations(War.defenders, war_defenders)
+        bulk_set_relations(War.targeted_titles, war_titles)
         mark_as_done(War, count, start_date)
 
         # Mass cleaning
         all_deleted = collections.Counter()
         if purge:
             for model, keys in tqdm(all_objects.items(), desc=f"Purge"):
-                deleted, total_deleted = model.objects.exclude(id__in=keys).delete()
-                all_deleted.update(total_deleted or {})
+                deleted_keys = [key for key in model.objects.values_list("pk", flat=True).iterator() if key not in keys]
+                for index in range(0, len(deleted_keys), 1000):
+                    deleted, total_deleted = model.objects.filter(pk__in=deleted_keys[index : index + 1000]).delete()
+                    all_deleted.update(total_deleted or {})
             for key, value in sorted(all_deleted.items()):
                 logger.info(f"{value} {key} deleted!")
 
-        with open("_all_missings.json", "w") as file:
-            json.dump(all_missings, file, indent=4, sort_keys=True)
-        with open("_all_duplicates.json", "w") as file:
-            json.dump(all_duplicates, file, indent=4, sort_keys=True)
+        all_missings = {model: sorted(keys) for model, keys in all_missings.items()}
+        save_json("_all_missings.json", all_missings)
+        save_json("_all_duplicates.json", all_duplicates)
+        save_json("_all_stats.json", all_stats)
         total_time = (datetime.datetime.now() - global_start).total_seconds()
         logger.info(f"Importing data in {total_time:0.2f}s")
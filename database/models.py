@@ -1,12 +1,17 @@
+import collections
 import logging
 
 from common.fields import JsonField
-from common.models import CommonModel, Entity, EntityQuerySet
+from common.models import CommonModel, Entity, EntityQuerySet, Global, History, HistoryField
+from common.settings import settings as common_settings
+from common.utils import get_current_user, json_encode, to_tuple
 from django.contrib.auth.models import AbstractUser
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.db.models.utils import resolve_callables
+from django.utils.timezone import now
 
 from database.ckparser import parse_text
 
@@ -18,6 +23,212 @@ def to_pdx_date(date):
     return f"{year}.{month}.{day}"
 
 
+def get_log_users(objects):
+    """
+    Bulk version of Entity.must_log, the current user is only looked up once for all the entities
+    :param objects: Entities
+    :return: List of (entity, user) tuples for the entities to log
+    """
+    if common_settings.IGNORE_LOG is True:
+        return []
+    current_user, users = get_current_user(), []
+    for obj in objects:
+        if obj._ignore_log is True:
+            continue
+        obj._current_user = user = obj._current_user or current_user
+        if (common_settings.IGNORE_LOG_NO_USER is True or obj._ignore_log_no_user is True) and not user:
+            continue
+        users.append((obj, user if user and user.pk else None))
+    return users
+
+
+def get_field_editable(obj, field_name):
+    try:
+        return obj._meta.get_field(field_name).editable
+    except Exception as error:
+        logger.warning(error, exc_info=True)
+        return True
+
+
+def log_bulk_save(objects, created, using=None, batch_size=1000):
+    """
+    Bulk version of log_save from common, creates the histories of several saved entities at once
+    :param objects: Saved entities, their data before saving being still in _copy
+    :param created: Entities newly created?
+    :param using: Database alias
+    :param batch_size: Number of records per query
+    :return: Nothing
+    """
+    histories, updated_histories, history_fields = [], [], []
+    for obj, user in get_log_users(objects):
+        exclude_fields = set(obj._ignore_log) if isinstance(obj._ignore_log, (list, set, tuple)) else set()
+        if common_settings.IGNORE_LOG_ENTITY_FIELDS:
+            exclude_fields.update(("modification_date", "current_user"))
+        old_data = {key: value for key, value in obj._copy.items() if key not in exclude_fields}
+        new_data = obj.to_dict(editables=True, excludes=exclude_fields)
+        if not set(to_tuple(new_data)) ^ set(to_tuple(old_data)):
+            continue
+        history = obj._history
+        if not history:
+            history = obj._history = History(
+                user=user,
+                status=History.RESTORE if obj._restore else [History.UPDATE, History.CREATE][created],
+                content_type=obj.model_type,
+                object_id=obj.pk,
+                object_uid=obj.uuid,
+                object_str=str(obj),
+                reason=obj._reason,
+                data=old_data,
+                data_size=len(json_encode(old_data)),
+                admin=obj._from_admin,
+                collector_update=obj._collector_update,
+                collector_delete=obj._collector_delete,
+            )
+            histories.append(history)
+        elif history.status in (History.UPDATE, History.RESTORE):
+            updated_histories.append(history)
+        if history.status not in (History.UPDATE, History.RESTORE):
+            continue
+        fields_count = 0
+        for key, new_value in new_data.items():
+            old_value = old_data.get(key, None)
+            if old_value == new_value:
+                continue
+            history_fields.append(
+                HistoryField(
+                    history=history,
+                    field_name=key,
+                    old_value=None if old_value is None else str(old_value),
+                    new_value=None if new_value is None else str(new_value),
+                    data=old_value,
+                    data_size=len(json_encode(old_value)),
+                    editable=get_field_editable(obj, key),
+                )
+            )
+            fields_count += 1
+        history.fields_count = (history.fields_count or 0) + fields_count
+    if not histories and not updated_histories:
+        return
+    with transaction.atomic(using=using):
+        History.objects.using(using).bulk_create(histories, batch_size=batch_size)
+        History.objects.using(using).bulk_update(updated_histories, ("fields_count",), batch_size=batch_size)
+        HistoryField.objects.using(using).bulk_create(history_fields, batch_size=batch_size)
+
+
+def log_bulk_m2m(field, relations, using=None, batch_size=1000):
+    """
+    Bulk version of log_m2m from common, creates the histories of a many-to-many field of several entities at once
+    Removed and added relations are logged separately in that order, the same way as the set() of a related manager
+    :param field: Many-to-many field
+    :param relations: Dictionary of entities with the (old primary keys, new primary keys) tuple of their relations
+    :param using: Database alias
+    :param batch_size: Number of records per query
+    :return: Nothing
+    """
+    histories, updated_histories, history_fields = [], [], []
+    for obj, user in get_log_users(relations):
+        if isinstance(obj._ignore_log, (list, set, tuple)) and field.name in obj._ignore_log:
+            continue
+        old_value, new_value = relations[obj]
+        removed, added = set(old_value) - set(new_value), set(new_value) - set(old_value)
+        if not removed and not added:
+            continue
+        history = obj._history
+        if not history:
+            history = obj._history = History(
+                user=user,
+                status=History.M2M,
+                content_type=obj.model_type,
+                object_id=obj.pk,
+                object_uid=obj.uuid,
+                object_str=str(obj),
+                reason=obj._reason,
+                data={},
+                admin=obj._from_admin,
+                collector_update=obj._collector_update,
+                collector_delete=obj._collector_delete,
+            )
+            histories.append(history)
+        else:
+            updated_histories.append(history)
+        history.data = history.data or {}
+        history.data[field.name] = old_value
+        history.data_size = len(json_encode(history.data))
+        steps = []
+        if removed:
+            steps.append((HistoryField.REMOVE_M2M, old_value, [value for value in old_value if value not in removed]))
+        if added:
+            kept_value = steps[-1][2] if steps else old_value
+            steps.append(
+                (HistoryField.ADD_M2M, kept_value, kept_value + [value for value in new_value if value in added])
+            )
+        for status_m2m, step_old_value, step_new_value in steps:
+            history_fields.append(
+                HistoryField(
+                    history=history,
+                    field_name=field.name,
+                    old_value=" | ".join(str(value) for value in step_old_value) if step_old_value else None,
+                    new_value=" | ".join(str(value) for value in step_new_value) if step_new_value else None,
+                    data=step_old_value,
+                    data_size=len(json_encode(step_old_value)),
+                    status_m2m=status_m2m,
+                    editable=field.editable,
+                )
+            )
+        history.fields_count = (history.fields_count or 0) + len(steps)
+    if not histories and not updated_histories:
+        return
+    with transaction.atomic(using=using):
+        History.objects.using(using).bulk_create(histories, batch_size=batch_size)
+        History.objects.using(using).bulk_update(
+            updated_histories, ("data", "data_size", "fields_count"), batch_size=batch_size
+        )
+        HistoryField.objects.using(using).bulk_create(history_fields, batch_size=batch_size)
+
+
+def bulk_set_relations(descriptor, relations, batch_size=5000):
+    """
+    Bulk version of the set() of a many-to-many related manager for several entities at once
+    :param descriptor: Many-to-many descriptor of the model (eg. Trait.opposites)
+    :param relations: Dictionary of entities with the list of their related entities (None are ignored)
+    :param batch_size: Number of records per query
+    :return: Nothing
+    """
+    if not relations:
+        return
+    field, through = descriptor.field, descriptor.through
+    source, target = f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+    symmetrical = field.remote_field.symmetrical
+    sources = list({obj.pk for obj in relations})
+    old_relations, new_relations = collections.defaultdict(list), collections.defaultdict(list)
+    for index in range(0, len(sources), batch_size):
+        filters = Q(**{f"{source}__in": sources[index : index + batch_size]})
+        for source_id, target_id in through.objects.filter(filters).values_list(source, target):
+            old_relations[source_id].append(target_id)
+        if symmetrical:
+            filters |= Q(**{f"{target}__in": sources[index : index + batch_size]})
+        through.objects.filter(filters).delete()
+    rows = {}
+    for obj, subobjects in relations.items():
+        for subobject in subobjects:
+            if subobject is None:
+                continue
+            rows[obj.pk, subobject.pk] = True
+            if symmetrical:
+                rows[subobject.pk, obj.pk] = True
+    through.objects.bulk_create(
+        [through(**{source: source_id, target: target_id}) for source_id, target_id in rows],
+        batch_size=batch_size,
+    )
+    for source_id, target_id in rows:
+        new_relations[source_id].append(target_id)
+    log_bulk_m2m(
+        field,
+        {obj: (old_relations[obj.pk], new_relations[obj.pk]) for obj in relations},
+        batch_size=batch_size,
+    )
+
+
 class User(AbstractUser, Entity):
     can_use_api = models.BooleanField(default=False)
 
@@ -40,6 +251,94 @@ class BaseModelQuerySet(EntityQuerySet):
                 logger.info(f"Ignored {obj._meta.verbose_name} ({obj.keys}) due to work in progress")
         return obj, False
 
+    def import_bulk_update_or_create(self, rows, batch_size=1000):
+        """
+        Bulk version of import_update_or_create
+        :param rows: List of (lookups, defaults) tuples, lookups being the unique fields of the model
+        :param batch_size: Number of records per query
+        :return: List of (object, created) tuples in the same order as rows
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        lookup_fields = [self.model._meta.get_field(name) for name in rows[0][0]]
+
+        def get_key(lookups):
+            values = []
+            for field in lookup_fields:
+                value = lookups[field.name]
+                if field.is_relation:
+                    value, field = getattr(value, "pk", value), field.target_field
+                values.append(field.to_python(value))
+            return tuple(values)
+
+        keys = [get_key(lookups) for lookups, _ in rows]
+        first_field, first_keys = lookup_fields[0], list(dict.fromkeys(key[0] for key in keys))
+        existing_objects = {}
+        for index in range(0, len(first_keys), batch_size):
+            queryset = self.filter(**{f"{first_field.attname}__in": first_keys[index : index + batch_size]})
+            for obj in queryset:
+                existing_objects[tuple(getattr(obj, field.attname) for field in lookup_fields)] = obj
+        created_objects, updated_objects, results = {}, {}, []
+        for key, (lookups, defaults) in zip(keys, rows):
+            if obj := existing_objects.get(key):
+                if getattr(obj, "wip", False):
+                    logger.info(f"Ignored {obj._meta.verbose_name} ({obj.keys}) due to work in progress")
+                    results.append((obj, False))
+                    continue
+                for k, v in resolve_callables(defaults):
+                    setattr(obj, k, v)
+                updated_objects[key] = obj
+                results.append((obj, False))
+            elif obj := created_objects.get(key):
+                for k, v in resolve_callables(defaults):
+                    setattr(obj, k, v)
+                results.append((obj, False))
+            else:
+                obj = created_objects[key] = self.model(**lookups, **dict(resolve_callables(defaults)))
+                results.append((obj, True))
+        with transaction.atomic(using=self.db):
+            if created_objects:
+                self.bulk_create(created_objects.values(), batch_size=batch_size)
+                if not (common_settings.IGNORE_GLOBAL is True or self.model._ignore_global is True):
+                    content_type = ContentType.objects.get_for_model(self.model)
+                    Global.objects.using(self.db).bulk_create(
+                        [
+                            Global(content_type=content_type, object_id=obj.pk, object_uid=obj.uuid)
+                            for obj in created_objects.values()
+                        ],
+                        batch_size=batch_size,
+                    )
+                log_bulk_save(created_objects.values(), True, using=self.db, batch_size=batch_size)
+            self.import_bulk_update(updated_objects.values(), batch_size=batch_size)
+        for obj in created_objects.values():
+            obj._copy = obj.to_dict(editables=True)
+        return results
+
+    def import_bulk_update(self, objects, batch_size=1000):
+        """
+        Bulk save of the modified fields of several objects
+        :param objects: Objects to save, unmodified ones are ignored
+        :param batch_size: Number of records per query
+        :return: List of updated objects
+        """
+        updated_objects, update_fields = {}, {"modification_date"}
+        for obj in objects:
+            if modified := obj.modified:
+                updated_objects[obj.pk] = obj
+                update_fields.update(modified)
+        if not updated_objects:
+            return []
+        modification_date = now()
+        for obj in updated_objects.values():
+            obj.modification_date = modification_date
+        with transaction.atomic(using=self.db):
+            self.bulk_update(updated_objects.values(), update_fields, batch_size=batch_size)
+            log_bulk_save(updated_objects.values(), False, using=self.db, batch_size=batch_size)
+        for obj in updated_objects.values():
+            obj._copy = obj.to_dict(editables=True)
+        return list(updated_objects.values())
+
 
 class BaseModel(Entity):
     id = models.CharField(max_length=64, primary_key=True, editable=True)
@@ -471,6 +770,7 @@ class CharacterHistory(Entity, BaseCharacter):
         related_name="traits_removed",
     )
     raw_data = JsonField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     _ignore_log = ("raw_data",)
 
@@ -622,6 +922,7 @@ class CultureEthnicity(Entity):
         related_name="cultures",
     )
     chance = models.PositiveSmallIntegerField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     @property
     def keys(self):
@@ -729,6 +1030,7 @@ class CultureOrHeritageHistory(Entity):
         related_name="%(class)s_discovered",
     )
     raw_data = JsonField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     _ignore_log = ("raw_data",)
 
@@ -814,6 +1116,7 @@ class ReligionTrait(Entity):
     )
     is_virtue = models.BooleanField(default=False)
     piety = models.FloatField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     @property
     def keys(self):
@@ -865,6 +1168,7 @@ class DoctrineTrait(Entity):
     )
     is_virtue = models.BooleanField(default=False)
     piety = models.SmallIntegerField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     @property
     def keys(self):
@@ -966,6 +1270,7 @@ class TraitCompatibility(Entity):
         related_name="+",
     )
     score = models.SmallIntegerField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.first} - {self.trait} ({self.score})"
@@ -983,6 +1288,7 @@ class TraitTrack(Entity, BaseTrait):
     code = models.CharField(max_length=16, blank=True)
     level = models.PositiveSmallIntegerField()
     raw_data = JsonField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     def __str__(self):
         if self.code:
@@ -1087,6 +1393,7 @@ class TitleHistory(Entity):
         related_name="title_history",
     )
     raw_data = JsonField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     _ignore_log = ("raw_data",)
 
@@ -1197,6 +1504,7 @@ class ProvinceHistory(Entity):
         related_name="province_history",
     )
     raw_data = JsonField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     _ignore_log = ("raw_data",)
 
@@ -1298,6 +1606,7 @@ class TerrainModifier(Entity):
     toughness = models.SmallIntegerField(blank=True, null=True)
     pursuit = models.SmallIntegerField(blank=True, null=True)
     screen = models.SmallIntegerField(blank=True, null=True)
+    objects = BaseModelQuerySet.as_manager()
 
     @property
     def keys(self):
@@ -1318,6 +1627,7 @@ class Counter(Entity):
     )
     type = models.CharField(max_length=16, blank=True, choices=MEN_AT_ARMS_TYPES)
     factor = models.FloatField(default=1.0)
+    objects = BaseModelQuerySet.as_manager()
 
     @property
     def keys(self):
@@ -1,3 +1,133 @@
+from common.models import Global, History, HistoryField
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from database.models import Character, Terrain, Trait, bulk_set_relations
+
+
+class ImportBulkUpdateOrCreateTestCase(TestCase):
+    def import_terrains(self, *rows):
+        return Terrain.objects.import_bulk_update_or_create(
+            (dict(id=key), dict(name=name, movement_speed=speed)) for key, name, speed in rows
+        )
+
+    def test_create(self):
+        results = self.import_terrains(("plains", "Plains", 1.0), ("hills", "Hills", 0.7))
+        self.assertEqual([(terrain.pk, created) for terrain, created in results], [("plains", True), ("hills", True)])
+        self.assertEqual(Terrain.objects.get(pk="hills").movement_speed, 0.7)
+        content_type = ContentType.objects.get_for_model(Terrain)
+        for terrain, _ in results:
+            self.assertEqual(Global.objects.filter(content_type=content_type, object_uid=terrain.uuid).count(), 1)
+            history = History.objects.get(content_type=content_type, object_id=terrain.pk)
+            self.assertEqual(history.status, History.CREATE)
+            self.assertEqual(terrain._history, history)
+        self.assertEqual(Global.objects.filter(content_type=content_type).count(), 2)
+
+    def test_update(self):
+        self.import_terrains(("plains", "Plains", 1.0), ("hills", "Hills", 0.7))
+        modification_date = Terrain.objects.get(pk="plains").modification_date
+        results = self.import_terrains(("plains", "Plains", 1.0), ("hills", "Hills", 0.5))
+        self.assertEqual([created for _, created in results], [False, False])
+        self.assertEqual(Terrain.objects.get(pk="hills").movement_speed, 0.5)
+        self.assertEqual(Terrain.objects.get(pk="plains").modification_date, modification_date)
+        history = History.objects.get(object_id="hills", status=History.UPDATE)
+        self.assertEqual(history.fields_count, 1)
+        field = HistoryField.objects.get(history=history)
+        self.assertEqual((field.field_name, field.old_value, field.new_value), ("movement_speed", "0.7", "0.5"))
+        self.assertFalse(History.objects.filter(object_id="plains", status=History.UPDATE).exists())
+        self.assertEqual(Global.objects.count(), 2)
+
+    def test_unchanged(self):
+        self.import_terrains(("plains", "Plains", 1.0))
+        terrain = Terrain.objects.get(pk="plains")
+        with CaptureQueriesContext(connection) as context:
+            results = self.import_terrains(("plains", "Plains", 1.0))
+        self.assertFalse([query for query in context.captured_queries if query["sql"].startswith(("INSERT", "UPDATE"))])
+        self.assertEqual(results, [(terrain, False)])
+        self.assertEqual(Terrain.objects.get(pk="plains").modification_date, terrain.modification_date)
+        self.assertEqual(History.objects.filter(object_id="plains").count(), 1)
+
+    def test_wip(self):
+        self.import_terrains(("plains", "Plains", 1.0))
+        Terrain.objects.filter(pk="plains").update(wip=True, name="Work in progress")
+        with self.assertLogs("database.models", level="INFO"):
+            ((terrain, created),) = self.import_terrains(("plains", "Plains", 0.5))
+        self.assertFalse(created)
+        terrain = Terrain.objects.get(pk="plains")
+        self.assertEqual((terrain.name, terrain.movement_speed), ("Work in progress", 1.0))
+        self.assertFalse(History.objects.filter(object_id="plains", status=History.UPDATE).exists())
+
+    def test_duplicates(self):
+        results = self.import_terrains(("plains", "Plains", 1.0), ("plains", "Flat plains", 0.9))
+        self.assertEqual([created for _, created in results], [True, False])
+        self.assertIs(results[0][0], results[1][0])
+        terrain = Terrain.objects.get(pk="plains")
+        self.assertEqual((terrain.name, terrain.movement_speed), ("Flat plains", 0.9))
+        self.assertEqual(Global.objects.count(), 1)
+        results = self.import_terrains(("plains", "Plains", 1.0), ("plains", "Flat plains", 0.8))
+        self.assertEqual([created for _, created in results], [False, False])
+        self.assertEqual(Terrain.objects.get(pk="plains").movement_speed, 0.8)
+        self.assertEqual(History.objects.filter(object_id="plains", status=History.UPDATE).count(), 1)
+
+
+class BulkSetRelationsTestCase(TestCase):
+    def setUp(self):
+        self.traits = {
+            key: trait
+            for key, (trait, _) in zip(
+                ("brave", "craven", "calm", "wrathful"),
+                Trait.objects.import_bulk_update_or_create(
+                    (dict(id=key), dict(name=key.title())) for key in ("brave", "craven", "calm", "wrathful")
+                ),
+            )
+        }
+
+    def get_opposites(self):
+        return set(Trait.opposites.through.objects.values_list("from_trait_id", "to_trait_id"))
+
+    def test_symmetrical(self):
+        brave, craven, calm, wrathful = self.traits.values()
+        bulk_set_relations(Trait.opposites, {brave: [craven], calm: [wrathful, None]})
+        self.assertEqual(
+            self.get_opposites(),
+            {("brave", "craven"), ("craven", "brave"), ("calm", "wrathful"), ("wrathful", "calm")},
+        )
+        bulk_set_relations(Trait.opposites, {brave: [wrathful]})
+        self.assertEqual(
+            self.get_opposites(),
+            {("brave", "wrathful"), ("wrathful", "brave"), ("calm", "wrathful"), ("wrathful", "calm")},
+        )
+        self.assertEqual(set(craven.opposites.all()), set())
+        self.assertEqual(set(wrathful.opposites.all()), {brave, calm})
+
+    def test_history(self):
+        brave, craven, calm, wrathful = self.traits.values()
+        Character.objects.create(id="1", name="Charles")
+        character = Character.objects.get(pk="1")
+        bulk_set_relations(Character.traits, {character: [brave, calm]})
+        history = History.objects.get(object_id="1", status=History.M2M)
+        field = HistoryField.objects.get(history=history)
+        self.assertEqual(
+            (field.field_name, field.status_m2m, field.old_value, field.new_value),
+            ("traits", HistoryField.ADD_M2M, None, "brave | calm"),
+        )
+        bulk_set_relations(Character.traits, {character: [calm, wrathful]})
+        history.refresh_from_db()
+        self.assertEqual(history.fields_count, 3)
+        self.assertEqual(
+            list(
+                HistoryField.objects.filter(history=history)
+                .order_by("pk")
+                .values_list("status_m2m", "old_value", "new_value")[1:]
+            ),
+            [
+                (HistoryField.REMOVE_M2M, "brave | calm", "calm"),
+                (HistoryField.ADD_M2M, "calm", "calm | wrathful"),
+            ],
+        )
+        bulk_set_relations(Character.traits, {character: [calm, wrathful]})
+        history.refresh_from_db()
+        self.assertEqual(history.fields_count, 3)
+        self.assertEqual(set(character.traits.all()), {calm, wrathful})